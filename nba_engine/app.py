@@ -40,8 +40,8 @@ from paths import (
 from storage import (
     init_db,
     upsert_daily_slate,
-    upsert_game,
-    upsert_daily_pick_if_unlocked,
+    upsert_games_bulk,
+    upsert_daily_picks_bulk,
     get_daily_picks,
     lock_all_started_games,
     compute_stats,
@@ -2033,8 +2033,8 @@ class NBAPredictor(tk.Tk):
                     'start_time_utc': getattr(g, 'start_time_utc', None),
                 }
         
-        saved = 0
-        locked = 0
+        games = []
+        picks = []
         
         for score in scores:
             # Determine game_id - use API game_id if available, else generate
@@ -2047,15 +2047,15 @@ class NBAPredictor(tk.Tk):
             
             start_time_utc = api_info.get('start_time_utc')
             
-            # Upsert game record with start time
-            upsert_game(
-                game_id=game_id,
-                game_date=run_date,
-                away_team=score.away_team,
-                home_team=score.home_team,
-                start_time_utc=start_time_utc,
-                status="scheduled",
-            )
+            # Game record with start time
+            games.append({
+                'game_id': game_id,
+                'game_date': run_date,
+                'away_team': score.away_team,
+                'home_team': score.home_team,
+                'start_time_utc': start_time_utc,
+                'status': "scheduled",
+            })
             
             # Determine pick side
             pick_side = "HOME" if score.predicted_winner == score.home_team else "AWAY"
@@ -2075,16 +2075,14 @@ class NBAPredictor(tk.Tk):
                 'internal_edge': score.edge_score_total,
                 'internal_margin': score.projected_margin_home,
             }
-            
-            # Try to save pick (will be blocked if game has started)
-            was_saved, is_locked = upsert_daily_pick_if_unlocked(
-                run_date, game_id, pick_data, now_local
-            )
-            
-            if was_saved:
-                saved += 1
-            if is_locked:
-                locked += 1
+            picks.append((game_id, pick_data))
+        
+        # Upsert all games, then try to save all picks (blocked if game has started)
+        upsert_games_bulk(games)
+        results = upsert_daily_picks_bulk(run_date, picks, now_local)
+        
+        saved = sum(1 for was_saved, _ in results if was_saved)
+        locked = sum(1 for _, is_locked in results if is_locked)
         
         return saved, locked
     
@@ -7,6 +7,7 @@ canonical categories for accurate availability calculations.
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 import re
 import unicodedata
@@ -119,6 +120,21 @@ def normalize_availability(
     return CanonicalStatus.AVAILABLE
 
 
+# Name suffixes, stripped in this order (before punctuation removal)
+_SUFFIX_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\s+jr\.?$',
+        r'\s+sr\.?$',
+        r'\s+ii+$',
+        r'\s+iv$',
+        r'\s+v$',
+    )
+]
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=4096)
 def normalize_player_name(name: str) -> str:
     """
     Normalize player name for matching across different sources.
@@ -135,6 +151,9 @@ def normalize_player_name(name: str) -> str:
     
     Returns:
         Normalized name for comparison
+    
+    Results are memoized, since the same names are compared over and
+    over while matching injury reports against rosters.
     """
     if not name:
         return ""
@@ -143,23 +162,18 @@ def normalize_player_name(name: str) -> str:
     name = name.lower()
     
     # Normalize unicode characters (accents -> base characters)
-    # NFD decomposes characters, then we remove combining marks
-    name = unicodedata.normalize('NFD', name)
-    name = ''.join(c for c in name if unicodedata.category(c) != 'Mn')
+    # NFD decomposes characters, then we remove combining marks.
+    # Plain ASCII names have nothing to decompose.
+    if not name.isascii():
+        name = unicodedata.normalize('NFD', name)
+        name = ''.join(c for c in name if unicodedata.category(c) != 'Mn')
     
     # Remove suffixes (must be done before punctuation removal)
-    suffix_patterns = [
-        r'\s+jr\.?$',
-        r'\s+sr\.?$',
-        r'\s+ii+$',
-        r'\s+iv$',
-        r'\s+v$',
-    ]
-    for pattern in suffix_patterns:
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
+    for pattern in _SUFFIX_PATTERNS:
+        name = pattern.sub('', name)
     
     # Remove punctuation except spaces
-    name = re.sub(r"[^\w\s]", "", name)
+    name = _PUNCTUATION_RE.sub("", name)
     
     # Collapse multiple spaces and strip
     name = " ".join(name.split())
@@ -5,7 +5,7 @@ Fetches player stats to calculate impact scores for lineup adjustment.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional
 import time
 
 from nba_api.stats.endpoints import leaguedashplayerstats
@@ -24,6 +24,23 @@ HEADERS = {
 TEAM_ID_TO_ABBREV = {team['id']: team['abbreviation'] for team in nba_teams.get_teams()}
 
 
+def _resolve_abbrev(row: Mapping) -> Optional[str]:
+    """
+    Resolve a stats row to its team abbreviation via TEAM_ID.
+    
+    TEAM_ID may arrive as an int, float or numeric string.
+    
+    Returns:
+        Team abbreviation, or None if the row can't be mapped to a team.
+    """
+    team_id = row.get("TEAM_ID")
+    try:
+        team_id = int(float(team_id))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return TEAM_ID_TO_ABBREV.get(team_id)
+
+
 @dataclass
 class PlayerImpact:
     """Player impact data for lineup adjustment, roster display, and projections."""
@@ -78,10 +95,9 @@ def get_player_stats(
             team_players = {}
             
             for _, row in df.iterrows():
-                team_id = row.get("TEAM_ID")
-                team_abbrev = TEAM_ID_TO_ABBREV.get(team_id, "UNK")
+                team_abbrev = _resolve_abbrev(row)
                 
-                if team_abbrev == "UNK":
+                if team_abbrev is None:
                     continue
                 
                 mpg = float(row.get("MIN", 0) or 0)
@@ -197,9 +197,26 @@ def ensure_distinct_copies(
     """
     Ensure home and away stats are distinct deep copies.
     
-    This prevents shared reference bugs.
+    This prevents shared reference bugs. Stats dicts hold scalars and
+    plain containers, so they are copied directly rather than through
+    copy.deepcopy's generic (and much slower) machinery.
     """
-    return copy.deepcopy(home_stats), copy.deepcopy(away_stats)
+    return _copy_stats(home_stats), _copy_stats(away_stats)
+
+
+# Immutable values that can be shared between copies as-is
+_ATOMIC_TYPES = (int, float, str, bool, type(None))
+
+
+def _copy_stats(value: Any) -> Any:
+    """Deep-copy a stats value, recursing only into dicts and lists."""
+    if type(value) is dict:
+        return {k: _copy_stats(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_stats(v) for v in value]
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    return copy.deepcopy(value)
 
 
 def count_identical_factors(debug_infos: list[FactorDebugInfo]) -> dict:
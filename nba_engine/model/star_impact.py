@@ -10,6 +10,7 @@ Implements a tiered Star Impact system that:
 
 from dataclasses import dataclass
 from typing import Optional
+import heapq
 import warnings
 
 
@@ -23,6 +24,20 @@ STAR_EDGE_CLAMP = 6.0
 # Minimum MPG to be considered rotation player
 MIN_ROTATION_MPG = 20.0
 
+# Availability multiplier by lowercased player status
+STATUS_MULTIPLIERS = {
+    # OUT
+    **dict.fromkeys(["out", "o", "inactive", "dnp"], 0.0),
+    # DOUBTFUL
+    **dict.fromkeys(["doubtful", "d", "unlikely"], 0.25),
+    # QUESTIONABLE
+    **dict.fromkeys(["questionable", "q", "gtd", "game time decision", "day-to-day"], 0.60),
+    # PROBABLE
+    **dict.fromkeys(["probable", "p", "likely"], 0.85),
+    # AVAILABLE
+    **dict.fromkeys(["available", "active", "healthy", ""], 1.0),
+}
+
 
 @dataclass
 class StarDetail:
@@ -42,6 +57,9 @@ def status_multiplier(status: Optional[str]) -> float:
     """
     Get the availability multiplier for a player status.
     
+    Known statuses are a single STATUS_MULTIPLIERS lookup; an unknown
+    status warns on every call.
+    
     Args:
         status: Player status string (case-insensitive)
     
@@ -51,29 +69,11 @@ def status_multiplier(status: Optional[str]) -> float:
     if status is None:
         return 1.0
     
-    status_lower = status.lower().strip()
-    
-    # OUT statuses
-    if status_lower in ["out", "o", "inactive", "dnp"]:
-        return 0.0
-    
-    # DOUBTFUL
-    if status_lower in ["doubtful", "d", "unlikely"]:
-        return 0.25
-    
-    # QUESTIONABLE
-    if status_lower in ["questionable", "q", "gtd", "game time decision", "day-to-day"]:
-        return 0.60
-    
-    # PROBABLE
-    if status_lower in ["probable", "p", "likely"]:
-        return 0.85
-    
-    # AVAILABLE
-    if status_lower in ["available", "active", "healthy", ""]:
-        return 1.0
+    multiplier = STATUS_MULTIPLIERS.get(status.lower().strip())
+    if multiplier is not None:
+        return multiplier
     
-    # Unknown status - warn once and return 1.0
+    # Unknown status - warn and return 1.0
     warnings.warn(f"Unknown player status '{status}', treating as available", UserWarning)
     return 1.0
 
@@ -134,12 +134,13 @@ def select_star_tiers(players: list) -> dict:
         # Fallback: use all players if none meet MPG threshold
         rotation_candidates = players
     
-    # Sort by impact metric descending
-    sorted_players = sorted(rotation_candidates, key=impact_metric, reverse=True)
+    # Top 3 by impact metric (same order as a full descending sort,
+    # ties keep roster order) without sorting the whole rotation
+    top_players = heapq.nlargest(3, rotation_candidates, key=impact_metric)
     
     # Select tiers
-    tier_a = sorted_players[:1] if sorted_players else []
-    tier_b = sorted_players[1:3] if len(sorted_players) > 1 else []
+    tier_a = top_players[:1]
+    tier_b = top_players[1:3]
     
     return {"tier_a": tier_a, "tier_b": tier_b}
 
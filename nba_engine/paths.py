@@ -54,10 +54,16 @@ def get_data_root() -> Path:
     
     This returns a stable, user-accessible location that persists after
     the application exits, regardless of how it was launched.
+    Setting NBA_ENGINE_DATA_ROOT overrides the location (used by tests
+    to keep their files out of the real data directory).
     
     Returns:
         Path to the app data directory (created if needed)
     """
+    override = os.getenv('NBA_ENGINE_DATA_ROOT')
+    if override:
+        return Path(override)
+    
     if os.name == 'nt':  # Windows
         # Prefer APPDATA (C:\\Users\\<user>\\AppData\\Roaming)
         appdata = os.getenv('APPDATA')
@@ -11,10 +11,9 @@ from typing import List, Tuple, Optional
 from storage.db import (
     get_ungraded_daily_picks,
     get_games_for_date,
-    update_game_score,
-    grade_daily_pick,
+    update_game_scores,
+    grade_daily_picks_bulk,
     lock_all_started_games,
-    get_daily_picks,
     connect,
     get_now_local,
     get_today_date_local,
@@ -32,21 +31,15 @@ def update_games_from_scores(scores: List[GameScoreUpdate]) -> int:
     Returns:
         Number of games updated
     """
-    updated = 0
+    rows = [
+        (score.game_id, score.status, score.away_score, score.home_score)
+        for score in scores
+        if score.game_id
+    ]
     
-    for score in scores:
-        if not score.game_id:
-            continue
-        
-        update_game_score(
-            game_id=score.game_id,
-            status=score.status,
-            away_score=score.away_score,
-            home_score=score.home_score,
-        )
-        updated += 1
-    
-    return updated
+    update_game_scores(rows)
+    
+    return len(rows)
 
 
 def grade_picks_for_date(date_str: Optional[str] = None) -> Tuple[int, int, int]:
@@ -83,12 +76,11 @@ def grade_picks_for_date(date_str: Optional[str] = None) -> Tuple[int, int, int]
     # Build score lookup by game_id
     score_map = {s.game_id: s for s in scores}
     
-    # Get all picks for this date (including already graded for status check)
-    all_picks = get_daily_picks(date_str)
-    ungraded = [p for p in all_picks if p.get('result') == 'PENDING']
+    # Get ungraded picks for this date (filtered in SQL)
+    ungraded = get_ungraded_daily_picks(date_str)
     print(f"  Found {len(ungraded)} ungraded picks")
     
-    picks_graded = 0
+    grades = []
     picks_pending = 0
     
     for pick in ungraded:
@@ -130,12 +122,15 @@ def grade_picks_for_date(date_str: Optional[str] = None) -> Tuple[int, int, int]
         else:
             result = "L"
         
-        grade_daily_pick(slate_date, game_id, result)
-        picks_graded += 1
+        grades.append((slate_date, game_id, result))
         
         matchup = pick.get('matchup', f"{pick.get('away_team', '?')} @ {pick.get('home_team', '?')}")
         print(f"    {matchup}: {pick['pick_team']} ({pick_side}) -> {result}")
     
+    # Write every grade for the date in one transaction
+    grade_daily_picks_bulk(grades)
+    picks_graded = len(grades)
+    
     print(f"  Graded: {picks_graded}, Pending: {picks_pending}")
     
     return games_updated, picks_graded, picks_pending
@@ -169,6 +164,7 @@ def grade_all_pending() -> Tuple[int, int, int]:
     total_updated = 0
     total_graded = 0
     total_pending = 0
+    past_grades = []
     
     # Process each date
     for date_str, picks in picks_by_date.items():
@@ -195,9 +191,12 @@ def grade_all_pending() -> Tuple[int, int, int]:
                         continue  # Tie
                     
                     result = "W" if pick_side == winner_side else "L"
-                    grade_daily_pick(pick['slate_date'], pick['game_id'], result)
-                    total_graded += 1
+                    past_grades.append((pick['slate_date'], pick['game_id'], result))
                 else:
                     total_pending += 1
     
+    # Past dates need no fresh scores, so their grades are written together
+    grade_daily_picks_bulk(past_grades)
+    total_graded += len(past_grades)
+    
     return total_updated, total_graded, total_pending
@@ -6,7 +6,7 @@ Uses NBA's live scoreboard API (same as schedule.py) as the primary source.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional
 import time
@@ -18,9 +18,13 @@ import requests
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameScoreUpdate:
-    """Represents a game score update from the API."""
+    """
+    Represents a game score update from the API.
+    
+    Immutable; the status flags and winner are derived once at construction.
+    """
     game_id: str
     away_team: str
     home_team: str
@@ -29,14 +33,33 @@ class GameScoreUpdate:
     away_score: Optional[int] = None
     home_score: Optional[int] = None
     start_time_utc: Optional[str] = None
+    _is_final: bool = field(init=False, repr=False, compare=False)
+    _is_in_progress: bool = field(init=False, repr=False, compare=False)
+    _winner: Optional[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        status = self.status.lower()
+        is_final = status == "final"
+        
+        winner = None
+        if is_final and self.away_score is not None and self.home_score is not None:
+            if self.home_score > self.away_score:
+                winner = "HOME"
+            elif self.away_score > self.home_score:
+                winner = "AWAY"
+            # Tie (shouldn't happen in NBA) leaves winner as None
+        
+        object.__setattr__(self, "_is_final", is_final)
+        object.__setattr__(self, "_is_in_progress", status in ("in_progress", "live", "halftime"))
+        object.__setattr__(self, "_winner", winner)
     
     @property
     def is_final(self) -> bool:
-        return self.status.lower() == "final"
+        return self._is_final
     
     @property
     def is_in_progress(self) -> bool:
-        return self.status.lower() in ("in_progress", "live", "halftime")
+        return self._is_in_progress
     
     def get_winner_side(self) -> Optional[str]:
         """
@@ -45,15 +68,7 @@ class GameScoreUpdate:
         Returns:
             "HOME" if home won, "AWAY" if away won, None if tie or not final
         """
-        if not self.is_final or self.away_score is None or self.home_score is None:
-            return None
-        
-        if self.home_score > self.away_score:
-            return "HOME"
-        elif self.away_score > self.home_score:
-            return "AWAY"
-        else:
-            return None  # Tie (shouldn't happen in NBA)
+        return self._winner
 
 
 # ============================================================================
@@ -141,23 +156,25 @@ class NBALiveScoreProvider(ScoreProvider):
                 
                 status = self._parse_status(game_data)
                 
+                away_score = away_team.get("score")
+                home_score = home_team.get("score")
+                
+                # Convert score strings to ints if needed
+                if isinstance(away_score, str) and away_score.isdigit():
+                    away_score = int(away_score)
+                if isinstance(home_score, str) and home_score.isdigit():
+                    home_score = int(home_score)
+                
                 game = GameScoreUpdate(
                     game_id=game_data.get("gameId", ""),
                     away_team=away_team.get("teamTricode", ""),
                     home_team=home_team.get("teamTricode", ""),
                     game_date=api_date,
                     status=status,
-                    away_score=away_team.get("score"),
-                    home_score=home_team.get("score"),
+                    away_score=away_score,
+                    home_score=home_score,
                     start_time_utc=game_data.get("gameTimeUTC"),
                 )
-                
-                # Convert score strings to ints if needed
-                if isinstance(game.away_score, str) and game.away_score.isdigit():
-                    game.away_score = int(game.away_score)
-                if isinstance(game.home_score, str) and game.home_score.isdigit():
-                    game.home_score = int(game.home_score)
-                
                 games.append(game)
                 
         except requests.RequestException as e:
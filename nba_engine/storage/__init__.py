@@ -5,6 +5,7 @@ from .db import (
     get_db_path,
     connect,
     init_db,
+    batch,
     
     # Daily slates
     upsert_daily_slate,
@@ -12,17 +13,24 @@ from .db import (
     
     # Games
     upsert_game,
+    upsert_games_bulk,
+    upsert_game_returning,
     get_game,
     get_games_for_date,
     update_game_score,
+    update_game_scores,
     generate_game_id,
     
     # Daily picks (with locking)
     upsert_daily_pick_if_unlocked,
+    upsert_daily_picks_bulk,
     get_daily_picks,
     get_daily_pick,
+    get_daily_picks_by_ids,
     grade_daily_pick,
+    grade_daily_picks_bulk,
     get_ungraded_daily_picks,
+    iter_ungraded_daily_picks,
     
     # Locking
     is_game_locked,
@@ -43,26 +51,36 @@ from .db import (
     # Legacy compatibility
     insert_run,
     upsert_pick,
+    upsert_picks_bulk,
     get_ungraded_picks,
     grade_pick,
+    grade_picks_bulk,
 )
 
 __all__ = [
     'get_db_path',
     'connect',
     'init_db',
+    'batch',
     'upsert_daily_slate',
     'get_daily_slate',
     'upsert_game',
+    'upsert_games_bulk',
+    'upsert_game_returning',
     'get_game',
     'get_games_for_date',
     'update_game_score',
+    'update_game_scores',
     'generate_game_id',
     'upsert_daily_pick_if_unlocked',
+    'upsert_daily_picks_bulk',
     'get_daily_picks',
     'get_daily_pick',
+    'get_daily_picks_by_ids',
     'grade_daily_pick',
+    'grade_daily_picks_bulk',
     'get_ungraded_daily_picks',
+    'iter_ungraded_daily_picks',
     'is_game_locked',
     'lock_game_if_started',
     'lock_all_started_games',
@@ -75,6 +93,8 @@ __all__ = [
     'utc_to_local',
     'insert_run',
     'upsert_pick',
+    'upsert_picks_bulk',
     'get_ungraded_picks',
     'grade_pick',
+    'grade_picks_bulk',
 ]
@@ -15,13 +15,21 @@ Locking Logic:
 - Locked picks cannot be overwritten by subsequent runs that day
 """
 
+import atexit
 import sqlite3
 import csv
+import functools
+import json
+import threading
+import time
+from operator import itemgetter
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from uuid import uuid4
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Import paths module for persistent storage location
 import sys
@@ -44,17 +52,52 @@ except ImportError:
 
 DB_FILENAME = "nba_predictions.db"
 
+try:
+    _ET = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:
+    # No tz database available (e.g. Windows without tzdata) - fixed EST offset
+    _ET = timezone(timedelta(hours=-5))
+
+# Per-connection settings: one fsync per WAL commit instead of two, a ~20 MB
+# page cache, in-memory temp tables, and waiting up to 5 s on a busy database
+# rather than failing immediately
+_CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA cache_size = -20000;
+    PRAGMA temp_store = MEMORY;
+"""
+
+# INSERT ... RETURNING is available from SQLite 3.35
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
+# Size of sqlite3's per-connection prepared statement cache
+STATEMENT_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=1)
 def get_db_path() -> Path:
     """
     Get the path to the SQLite database file.
     
-    Uses the persistent data directory from paths module.
+    Uses the persistent data directory from paths module, unless
+    NBA_DB_PATH names a database file (tests use this to give each
+    worker its own file).
     Creates directory if it doesn't exist.
     
+    The result is cached for the life of the process; call
+    _reset_for_tests() after repointing DATA_ROOT or NBA_DB_PATH.
+    
     Returns:
         Path to the database file
     """
+    override = os.getenv('NBA_DB_PATH')
+    if override:
+        db_path = Path(override)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        return db_path
+    
     db_dir = DATA_ROOT
     db_dir.mkdir(parents=True, exist_ok=True)
     return db_dir / DB_FILENAME
@@ -64,155 +107,354 @@ def get_db_path() -> Path:
 # CONNECTION MANAGEMENT
 # ============================================================================
 
-def connect() -> sqlite3.Connection:
+def connect(check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Create a connection to the SQLite database.
     
-    Enables foreign keys and sets row_factory for dict-like access.
+    Enables foreign keys, applies the per-connection tuning PRAGMAs
+    (WAL itself is set once by init_db since it persists in the file)
+    and sets row_factory for dict-like access.
+    The connection runs in autocommit mode (isolation_level=None);
+    multi-statement writes open their own transaction with
+    _write_transaction().
+    
+    Module functions share a per-thread cached connection; call this
+    directly only when you need a separate connection you will close.
+    The schema is created on the first connection of the process.
+    
+    Args:
+        check_same_thread: Passed through to sqlite3.connect()
     
     Returns:
         sqlite3.Connection with row_factory set
     """
+    _ensure_schema()
+    return _open_connection(check_same_thread)
+
+
+def _open_connection(check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open and configure a connection without touching the schema (see connect)."""
     db_path = get_db_path()
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(
+        str(db_path),
+        isolation_level=None,
+        check_same_thread=check_same_thread,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(_CONNECTION_PRAGMAS)
     return conn
 
 
-def init_db():
+# One cached connection per thread, reused across calls
+_local = threading.local()
+_connections: Dict[threading.Thread, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+# Set once init_db() has run in this process
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+
+def _ensure_schema():
+    """Run init_db() once per process, on first use rather than at import."""
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if not _schema_ready:
+            init_db()
+
+
+def _get_connection() -> sqlite3.Connection:
     """
-    Initialize the database schema.
+    Get this thread's cached database connection, opening it on first use.
     
-    Creates tables and indexes if they don't exist.
-    Performs migrations for existing tables.
-    Safe to call multiple times.
+    Avoids reopening the file and re-applying PRAGMAs on every call.
+    Connections left behind by finished threads are closed here.
+    
+    Returns:
+        sqlite3.Connection owned by the current thread
     """
-    conn = connect()
-    cursor = conn.cursor()
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        # Only ever used by this thread, but may be closed from another
+        # one at exit or after this thread finishes
+        conn = connect(check_same_thread=False)
+        _local.conn = conn
+        with _connections_lock:
+            for thread in [t for t in _connections if not t.is_alive()]:
+                _connections.pop(thread).close()
+            _connections[threading.current_thread()] = conn
+    return conn
+
+
+def _close_all():
+    """Optimize and close every cached connection (registered with atexit)."""
+    with _connections_lock:
+        for conn in _connections.values():
+            try:
+                # Re-runs ANALYZE only for tables whose size changed significantly
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _connections.clear()
+
+
+def _reset_for_tests():
+    """
+    Forget the cached database path, schema flag and connections.
     
-    # =========================================================================
-    # Legacy tables (kept for backward compatibility and migration)
-    # =========================================================================
+    Call after repointing NBA_DB_PATH (or DATA_ROOT) so the next storage
+    call opens and initializes the new file instead of reusing the old one.
+    """
+    global _local, _schema_ready
+    _close_all()
+    # A fresh threading.local drops every thread's closed connection
+    _local = threading.local()
+    _schema_ready = False
+    get_db_path.cache_clear()
+
+
+@contextmanager
+def _write_transaction(conn: sqlite3.Connection):
+    """
+    Run a block of writes inside one BEGIN IMMEDIATE transaction.
     
-    # Create runs table (legacy)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS runs (
-            run_id TEXT PRIMARY KEY,
-            run_date TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            model_version TEXT DEFAULT 'v3.2',
-            notes TEXT
-        )
-    """)
+    The write lock is taken up front so checks and writes in the block
+    can't interleave with another writer. Commits on success and rolls
+    back if the block raises. If the caller already has a transaction
+    open, the block joins it through a savepoint: an error rolls back
+    just this block, and the commit is left to the caller.
     
-    # Create picks table (legacy)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS picks (
-            pick_id TEXT PRIMARY KEY,
-            run_id TEXT NOT NULL,
-            game_id TEXT NOT NULL,
-            matchup TEXT NOT NULL,
-            pick_team TEXT NOT NULL,
-            pick_side TEXT NOT NULL,
-            conf_pct REAL NOT NULL,
-            bucket TEXT NOT NULL,
-            pred_away_score INTEGER,
-            pred_home_score INTEGER,
-            pred_total REAL,
-            range_low REAL,
-            range_high REAL,
-            internal_edge REAL,
-            internal_margin REAL,
-            result TEXT DEFAULT 'PENDING',
-            graded_at TEXT
-        )
-    """)
+    Args:
+        conn: Connection opened with connect()
+    """
+    if conn.in_transaction:
+        conn.execute("SAVEPOINT write_block")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK TO write_block")
+            conn.execute("RELEASE write_block")
+            raise
+        conn.execute("RELEASE write_block")
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    # The connection's context manager commits on success, rolls back on error
+    with conn:
+        yield
+
+
+@contextmanager
+def batch():
+    """
+    Group several storage calls on this thread into one write transaction.
     
-    # =========================================================================
-    # New tables for daily slate with per-game locking
-    # =========================================================================
+    The module functions all use this thread's cached connection and join
+    a transaction that is already open, so everything inside the block
+    commits once at the end (or rolls back together if it raises).
+    Nested batch() blocks join the outermost one.
     
-    # Create daily_slates table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS daily_slates (
-            slate_date TEXT PRIMARY KEY,
-            last_run_at TEXT NOT NULL,
-            model_version TEXT DEFAULT 'v3.2',
-            notes TEXT
-        )
-    """)
+    Example:
+        with batch():
+            upsert_game(...)
+            upsert_daily_pick_if_unlocked(...)
+    """
+    with _write_transaction(_get_connection()):
+        yield
+
+
+def _execute_write(conn: sqlite3.Connection, sql: str, params: List[Tuple]) -> sqlite3.Cursor:
+    """
+    Run a write statement for one or more parameter rows.
     
-    # Create games table (updated with start_time_local)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS games (
-            game_id TEXT PRIMARY KEY,
-            game_date TEXT NOT NULL,
-            away_team TEXT NOT NULL,
-            home_team TEXT NOT NULL,
-            start_time_utc TEXT,
-            start_time_local TEXT,
-            status TEXT DEFAULT 'scheduled',
-            away_score INTEGER,
-            home_score INTEGER,
-            last_checked_at TEXT
-        )
-    """)
+    A single row runs as one autocommit statement, which is already
+    atomic, so it skips the BEGIN/COMMIT round trips. Several rows go
+    through executemany() inside one write transaction.
     
-    # Try to add start_time_local column if it doesn't exist (migration)
-    try:
-        cursor.execute("ALTER TABLE games ADD COLUMN start_time_local TEXT")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
+    Args:
+        conn: Connection opened with connect()
+        sql: Write statement with ? placeholders
+        params: Parameter tuples, one per row
     
-    # Create daily_picks table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS daily_picks (
-            slate_date TEXT NOT NULL,
-            game_id TEXT NOT NULL,
-            matchup TEXT NOT NULL,
-            pick_team TEXT NOT NULL,
-            pick_side TEXT NOT NULL,
-            conf_pct REAL NOT NULL,
-            bucket TEXT NOT NULL,
-            pred_away_score INTEGER,
-            pred_home_score INTEGER,
-            pred_total REAL,
-            range_low REAL,
-            range_high REAL,
-            internal_edge REAL,
-            internal_margin REAL,
-            locked INTEGER DEFAULT 0,
-            locked_at TEXT,
-            result TEXT DEFAULT 'PENDING',
-            graded_at TEXT,
-            PRIMARY KEY (slate_date, game_id)
-        )
-    """)
+    Returns:
+        The cursor, so callers can read rowcount
+    """
+    if len(params) == 1:
+        return conn.execute(sql, params[0])
+    with _write_transaction(conn):
+        return conn.executemany(sql, params)
+
+
+# Tables and indexes, run as one script by init_db(). Every statement is
+# idempotent so the script is safe to re-run against an existing database.
+_SCHEMA_SQL = """
+    -- =====================================================================
+    -- Legacy tables (kept for backward compatibility and migration)
+    -- =====================================================================
+    
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        run_date TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        model_version TEXT DEFAULT 'v3.2',
+        notes TEXT
+    );
+    
+    CREATE TABLE IF NOT EXISTS picks (
+        pick_id TEXT PRIMARY KEY,
+        run_id TEXT NOT NULL,
+        game_id TEXT NOT NULL,
+        matchup TEXT NOT NULL,
+        pick_team TEXT NOT NULL,
+        pick_side TEXT NOT NULL,
+        conf_pct REAL NOT NULL,
+        bucket TEXT NOT NULL,
+        pred_away_score INTEGER,
+        pred_home_score INTEGER,
+        pred_total REAL,
+        range_low REAL,
+        range_high REAL,
+        internal_edge REAL,
+        internal_margin REAL,
+        result TEXT DEFAULT 'PENDING',
+        graded_at TEXT
+    );
+    
+    -- =====================================================================
+    -- New tables for daily slate with per-game locking
+    -- =====================================================================
+    
+    CREATE TABLE IF NOT EXISTS daily_slates (
+        slate_date TEXT PRIMARY KEY,
+        last_run_at TEXT NOT NULL,
+        model_version TEXT DEFAULT 'v3.2',
+        notes TEXT
+    );
+    
+    CREATE TABLE IF NOT EXISTS games (
+        game_id TEXT PRIMARY KEY,
+        game_date TEXT NOT NULL,
+        away_team TEXT NOT NULL,
+        home_team TEXT NOT NULL,
+        start_time_utc TEXT,
+        start_time_local TEXT,
+        status TEXT DEFAULT 'scheduled',
+        away_score INTEGER,
+        home_score INTEGER,
+        last_checked_at TEXT
+    );
+    
+    CREATE TABLE IF NOT EXISTS daily_picks (
+        slate_date TEXT NOT NULL,
+        game_id TEXT NOT NULL,
+        matchup TEXT NOT NULL,
+        pick_team TEXT NOT NULL,
+        pick_side TEXT NOT NULL,
+        conf_pct REAL NOT NULL,
+        bucket TEXT NOT NULL,
+        pred_away_score INTEGER,
+        pred_home_score INTEGER,
+        pred_total REAL,
+        range_low REAL,
+        range_high REAL,
+        internal_edge REAL,
+        internal_margin REAL,
+        locked INTEGER DEFAULT 0,
+        locked_at TEXT,
+        result TEXT DEFAULT 'PENDING',
+        graded_at TEXT,
+        PRIMARY KEY (slate_date, game_id)
+    );
+    
+    -- Create indexes for common queries
+    -- (slate_date, conf_pct DESC) serves the per-slate JOIN + ORDER BY without
+    -- a sort and supersedes the old slate_date-only index
+    DROP INDEX IF EXISTS idx_daily_picks_slate;
+    CREATE INDEX IF NOT EXISTS idx_daily_picks_slate_conf
+    ON daily_picks(slate_date, conf_pct DESC, game_id);
+    
+    -- Partial index over the (small) set of ungraded picks, ordered to match
+    -- get_ungraded_daily_picks' ORDER BY slate_date DESC, conf_pct DESC
+    DROP INDEX IF EXISTS idx_daily_picks_pending;
+    CREATE INDEX IF NOT EXISTS idx_daily_picks_pending_recent
+    ON daily_picks(result, slate_date DESC, conf_pct DESC)
+    WHERE result = 'PENDING';
+    
+    -- (bucket, result) covers compute_stats' GROUP BY so it never touches the table;
+    -- it supersedes the old bucket-only index
+    DROP INDEX IF EXISTS idx_daily_picks_bucket;
+    CREATE INDEX IF NOT EXISTS idx_daily_picks_bucket_result
+    ON daily_picks(bucket, result);
+    
+    CREATE INDEX IF NOT EXISTS idx_daily_picks_result ON daily_picks(result);
+    
+    -- Most picks end up locked, so only index the unlocked ones
+    DROP INDEX IF EXISTS idx_daily_picks_locked;
+    CREATE INDEX IF NOT EXISTS idx_daily_picks_unlocked
+    ON daily_picks(slate_date) WHERE locked = 0;
+    
+    CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date);
+    CREATE INDEX IF NOT EXISTS idx_games_status ON games(status);
+    
+    -- Legacy indexes
+    CREATE INDEX IF NOT EXISTS idx_picks_run_id ON picks(run_id);
+    CREATE INDEX IF NOT EXISTS idx_picks_bucket ON picks(bucket);
+    CREATE INDEX IF NOT EXISTS idx_picks_result ON picks(result);
+    CREATE INDEX IF NOT EXISTS idx_picks_game_id ON picks(game_id);
+"""
+
+
+def init_db():
+    """
+    Initialize the database schema.
     
-    # Create indexes for common queries
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_picks_slate ON daily_picks(slate_date)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_picks_bucket ON daily_picks(bucket)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_picks_result ON daily_picks(result)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_picks_locked ON daily_picks(locked)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_status ON games(status)")
+    Creates tables and indexes if they don't exist.
+    Performs migrations for existing tables.
+    Safe to call multiple times.
     
-    # Legacy indexes
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_picks_run_id ON picks(run_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_picks_bucket ON picks(bucket)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_picks_result ON picks(result)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_picks_game_id ON picks(game_id)")
+    The DDL is sent as a single executescript() call wrapped in one
+    explicit transaction, so it is parsed in one pass and the database
+    is only synced to disk once.
+    """
+    global _schema_ready
     
-    conn.commit()
-    conn.close()
+    conn = _open_connection()
+    try:
+        # Persistent: readers no longer block the writer (can't run inside a transaction)
+        conn.execute("PRAGMA journal_mode = WAL")
+        
+        # Add start_time_local to games tables created before it existed (migration).
+        # Fails harmlessly when the column exists or the table isn't created yet.
+        try:
+            conn.execute("ALTER TABLE games ADD COLUMN start_time_local TEXT")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Gather stats once, when the composite indexes are first created
+        needs_analyze = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_daily_picks_slate_conf'"
+        ).fetchone() is None
+        
+        # executescript() commits any open transaction first, so the
+        # transaction is part of the script itself
+        conn.executescript(
+            "BEGIN IMMEDIATE;"
+            + _SCHEMA_SQL
+            + ("ANALYZE daily_picks;" if needs_analyze else "")
+            + "COMMIT;"
+        )
+    finally:
+        conn.close()
+    _schema_ready = True
 
 
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class WinrateStats:
     """Statistics computed from prediction history."""
     # Overall
@@ -248,7 +490,7 @@ class WinrateStats:
     low_pending: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyPick:
     """Represents a pick for a specific game on a specific date."""
     slate_date: str
@@ -271,6 +513,156 @@ class DailyPick:
     graded_at: Optional[str] = None
 
 
+# ============================================================================
+# SQL STATEMENTS
+# ============================================================================
+# Hot-path queries are kept as constant strings so sqlite3's statement
+# cache can reuse the prepared statement across calls.
+
+_SELECT_GAME_SQL = "SELECT * FROM games WHERE game_id = ?"
+
+_SELECT_GAME_STATE_SQL = """
+    SELECT start_time_local, status FROM games
+    WHERE game_id = ?
+"""
+
+_UPSERT_GAME_SQL = """
+    INSERT INTO games (game_id, game_date, away_team, home_team, start_time_utc,
+                      start_time_local, status, away_score, home_score, last_checked_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')))
+    ON CONFLICT(game_id) DO UPDATE SET
+        start_time_utc = COALESCE(excluded.start_time_utc, start_time_utc),
+        start_time_local = COALESCE(excluded.start_time_local, start_time_local),
+        status = COALESCE(excluded.status, status),
+        away_score = COALESCE(excluded.away_score, away_score),
+        home_score = COALESCE(excluded.home_score, home_score),
+        last_checked_at = excluded.last_checked_at
+"""
+
+_UPSERT_PICK_SQL = """
+    INSERT INTO picks (pick_id, run_id, game_id, matchup, pick_team, pick_side,
+                      conf_pct, bucket, pred_away_score, pred_home_score,
+                      pred_total, range_low, range_high, internal_edge,
+                      internal_margin, result)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(pick_id) DO UPDATE SET
+        result = excluded.result
+"""
+
+_UPDATE_GAME_SCORE_SQL = """
+    UPDATE games
+    SET status = ?, away_score = ?, home_score = ?,
+        last_checked_at = COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+    WHERE game_id = ?
+"""
+
+_GRADE_PICK_SQL = """
+    UPDATE picks
+    SET result = ?, graded_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')
+    WHERE pick_id = ?
+"""
+
+# Always returns exactly one row, even when the pick or game is missing
+_SELECT_LOCK_STATE_SQL = """
+    SELECT dp.locked, g.start_time_local, g.status
+    FROM (SELECT ? AS slate_date, ? AS game_id) k
+    LEFT JOIN daily_picks dp ON dp.slate_date = k.slate_date AND dp.game_id = k.game_id
+    LEFT JOIN games g ON g.game_id = k.game_id
+"""
+
+# The same, for a JSON array of game_ids in one statement (one row per id)
+_SELECT_LOCK_STATES_SQL = """
+    SELECT k.value AS game_id, dp.locked, g.start_time_local, g.status
+    FROM json_each(?) k
+    LEFT JOIN daily_picks dp ON dp.slate_date = ? AND dp.game_id = k.value
+    LEFT JOIN games g ON g.game_id = k.value
+"""
+
+_LOCK_PICK_SQL = """
+    UPDATE daily_picks
+    SET locked = 1, locked_at = ?
+    WHERE slate_date = ? AND game_id = ?
+"""
+
+_UPSERT_DAILY_PICK_SQL = """
+    INSERT INTO daily_picks (
+        slate_date, game_id, matchup, pick_team, pick_side,
+        conf_pct, bucket, pred_away_score, pred_home_score,
+        pred_total, range_low, range_high, internal_edge,
+        internal_margin, locked, result
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, 'PENDING')
+    ON CONFLICT(slate_date, game_id) DO UPDATE SET
+        matchup = excluded.matchup,
+        pick_team = excluded.pick_team,
+        pick_side = excluded.pick_side,
+        conf_pct = excluded.conf_pct,
+        bucket = excluded.bucket,
+        pred_away_score = excluded.pred_away_score,
+        pred_home_score = excluded.pred_home_score,
+        pred_total = excluded.pred_total,
+        range_low = excluded.range_low,
+        range_high = excluded.range_high,
+        internal_edge = excluded.internal_edge,
+        internal_margin = excluded.internal_margin
+    WHERE locked = 0
+"""
+
+# Parameter order for _UPSERT_DAILY_PICK_SQL after (slate_date, game_id)
+_PICK_FIELD_DEFAULTS = {
+    'matchup': '',
+    'pick_team': '',
+    'pick_side': '',
+    'conf_pct': 0,
+    'bucket': 'LOW',
+    'pred_away_score': None,
+    'pred_home_score': None,
+    'pred_total': None,
+    'range_low': None,
+    'range_high': None,
+    'internal_edge': None,
+    'internal_margin': None,
+}
+_pick_fields = itemgetter(*_PICK_FIELD_DEFAULTS)
+
+# Grading also locks the pick if it wasn't already
+_GRADE_DAILY_PICK_SQL = """
+    UPDATE daily_picks
+    SET result = ?,
+        graded_at = COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')),
+        locked = 1,
+        locked_at = COALESCE(locked_at, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+    WHERE slate_date = ? AND game_id = ?
+"""
+
+# One statement for both the all-dates and single-date cases; both walk
+# idx_daily_picks_pending_recent in order with no sort step
+_SELECT_UNGRADED_DAILY_PICKS_SQL = """
+    SELECT dp.*, g.away_team, g.home_team, g.status,
+           g.away_score, g.home_score, g.start_time_local
+    FROM daily_picks dp
+    JOIN games g ON dp.game_id = g.game_id
+    WHERE dp.result = 'PENDING' AND (?1 IS NULL OR dp.slate_date = ?1)
+    ORDER BY dp.slate_date DESC, dp.conf_pct DESC
+"""
+
+_SELECT_DAILY_PICK_SQL = """
+    SELECT dp.*, g.away_team, g.home_team, g.status,
+           g.away_score, g.home_score, g.start_time_local
+    FROM daily_picks dp
+    JOIN games g ON dp.game_id = g.game_id
+    WHERE dp.slate_date = ? AND dp.game_id = ?
+"""
+
+# The same, for a JSON array of game_ids
+_SELECT_DAILY_PICKS_BY_IDS_SQL = """
+    SELECT dp.*, g.away_team, g.home_team, g.status,
+           g.away_score, g.home_score, g.start_time_local
+    FROM daily_picks dp
+    JOIN games g ON dp.game_id = g.game_id
+    WHERE dp.slate_date = ? AND dp.game_id IN (SELECT value FROM json_each(?))
+"""
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -290,18 +682,93 @@ def generate_game_id(game_date: str, away_team: str, home_team: str) -> str:
     return f"{game_date}:{away_team}@{home_team}"
 
 
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """
+    Fetch all remaining rows from an executed cursor as plain dicts.
+    
+    The cursor should have row_factory set to None so rows arrive as tuples
+    and no intermediate sqlite3.Row objects are built.
+    
+    Args:
+        cursor: Cursor that has executed a SELECT
+    
+    Returns:
+        List of rows keyed by column name
+    """
+    columns = [d[0] for d in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+# Rows pulled per fetchmany() call when streaming results
+FETCH_CHUNK_SIZE = 500
+
+
+def _iter_dicts(cursor: sqlite3.Cursor) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield the remaining rows of an executed cursor as plain dicts.
+    
+    Rows are pulled FETCH_CHUNK_SIZE at a time, so only one chunk is held
+    in memory at once. Like _fetch_dicts(), expects row_factory None.
+    
+    Args:
+        cursor: Cursor that has executed a SELECT
+    
+    Yields:
+        Rows keyed by column name
+    """
+    columns = [d[0] for d in cursor.description]
+    while True:
+        rows = cursor.fetchmany(FETCH_CHUNK_SIZE)
+        if not rows:
+            return
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+def _game_has_started(start_time_local: Optional[str], status: Optional[str], now_local: str) -> bool:
+    """
+    Check whether a game has started based on its status and start time.
+    
+    Args:
+        start_time_local: Game start time in local/ET (ISO), may be None
+        status: Game status (scheduled, in_progress, final), may be None
+        now_local: Current local time (ISO)
+    
+    Returns:
+        True if the game is in progress, final, or past its start time
+    """
+    if status in ('in_progress', 'final'):
+        return True
+    return bool(start_time_local) and now_local >= start_time_local
+
+
+# Cached current ET time, refreshed at most once per NOW_CACHE_TTL seconds
+NOW_CACHE_TTL = 1.0
+_now_cache = {"t": float("-inf"), "now": "", "today": ""}
+
+
+def _refresh_now_cache():
+    """Recompute the cached ET timestamp and date if the TTL has expired."""
+    t = time.monotonic()
+    if t - _now_cache["t"] > NOW_CACHE_TTL:
+        now_et = datetime.now(_ET)
+        _now_cache["now"] = now_et.strftime("%Y-%m-%dT%H:%M:%S")
+        _now_cache["today"] = _now_cache["now"][:10]
+        _now_cache["t"] = t
+
+
 def get_now_local() -> str:
     """
     Get current time in Eastern Time as ISO string.
     
+    The value is cached for up to NOW_CACHE_TTL seconds so repeated lock
+    checks within one run don't re-read the clock.
+    
     Returns:
         ISO formatted datetime string in ET
     """
-    now_utc = datetime.now(timezone.utc)
-    # ET offset (simplified - doesn't handle DST precisely)
-    et_offset = timedelta(hours=-5)
-    now_et = now_utc + et_offset
-    return now_et.strftime("%Y-%m-%dT%H:%M:%S")
+    _refresh_now_cache()
+    return _now_cache["now"]
 
 
 def get_today_date_local() -> str:
@@ -311,10 +778,8 @@ def get_today_date_local() -> str:
     Returns:
         Date string in YYYY-MM-DD format
     """
-    now_utc = datetime.now(timezone.utc)
-    et_offset = timedelta(hours=-5)
-    now_et = now_utc + et_offset
-    return now_et.strftime("%Y-%m-%d")
+    _refresh_now_cache()
+    return _now_cache["today"]
 
 
 def utc_to_local(utc_str: str) -> Optional[str]:
@@ -331,32 +796,14 @@ def utc_to_local(utc_str: str) -> Optional[str]:
         return None
     
     try:
-        # Parse UTC time
-        if 'Z' in utc_str:
-            utc_str = utc_str.replace('Z', '+00:00')
-        
-        # Handle various formats
-        for fmt in ["%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S"]:
-            try:
-                dt = datetime.strptime(utc_str.split('+')[0].split('-')[0:3][0] + '-' + 
-                                       utc_str.split('-')[1] + '-' + utc_str.split('-')[2][:2] + 
-                                       'T' + utc_str.split('T')[1][:8], "%Y-%m-%dT%H:%M:%S")
-                break
-            except:
-                continue
-        else:
-            # Fallback: just parse as-is
-            dt = datetime.fromisoformat(utc_str.replace('Z', '+00:00'))
-        
-        # Convert to ET
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        
-        et_offset = timedelta(hours=-5)
-        dt_et = dt + et_offset
-        return dt_et.strftime("%Y-%m-%dT%H:%M:%S")
-    except Exception:
+        dt = datetime.fromisoformat(utc_str.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
         return None
+    
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    
+    return dt.astimezone(_ET).strftime("%Y-%m-%dT%H:%M:%S")
 
 
 # ============================================================================
@@ -378,7 +825,7 @@ def upsert_daily_slate(
         model_version: Model version string
         notes: Optional notes
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -389,9 +836,6 @@ def upsert_daily_slate(
             model_version = excluded.model_version,
             notes = COALESCE(excluded.notes, notes)
     """, (slate_date, last_run_at, model_version, notes))
-    
-    conn.commit()
-    conn.close()
 
 
 def get_daily_slate(slate_date: str) -> Optional[Dict[str, Any]]:
@@ -404,12 +848,11 @@ def get_daily_slate(slate_date: str) -> Optional[Dict[str, Any]]:
     Returns:
         Slate record or None if not found
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
     cursor.execute("SELECT * FROM daily_slates WHERE slate_date = ?", (slate_date,))
     row = cursor.fetchone()
-    conn.close()
     
     return dict(row) if row else None
 
@@ -428,6 +871,7 @@ def upsert_game(
     status: str = "scheduled",
     away_score: Optional[int] = None,
     home_score: Optional[int] = None,
+    now: Optional[str] = None,
 ) -> str:
     """
     Insert or update a game record.
@@ -442,37 +886,104 @@ def upsert_game(
         status: Game status (scheduled, in_progress, final)
         away_score: Away team final score (optional)
         home_score: Home team final score (optional)
+        now: Timestamp for last_checked_at (defaults to SQLite's local now)
     
     Returns:
         The game_id
     """
-    conn = connect()
+    upsert_games_bulk([{
+        'game_id': game_id,
+        'game_date': game_date,
+        'away_team': away_team,
+        'home_team': home_team,
+        'start_time_utc': start_time_utc,
+        'start_time_local': start_time_local,
+        'status': status,
+        'away_score': away_score,
+        'home_score': home_score,
+    }], now)
+    
+    return game_id
+
+
+def upsert_games_bulk(games: List[Dict[str, Any]], now: Optional[str] = None) -> List[str]:
+    """
+    Insert or update many game records in a single transaction.
+    
+    Args:
+        games: List of dicts with the same fields as upsert_game()
+            (game_id, game_date, away_team and home_team are required)
+        now: Timestamp for last_checked_at (defaults to SQLite's local now)
+    
+    Returns:
+        List of game_ids, in input order
+    """
+    if not games:
+        return []
+    
+    params = [_game_params(game, now) for game in games]
+    
+    conn = _get_connection()
+    
+    _execute_write(conn, _UPSERT_GAME_SQL, params)
+    
+    return [p[0] for p in params]
+
+
+def upsert_game_returning(game: Dict[str, Any], now: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Insert or update a game record and return the stored row.
+    
+    Saves the separate get_game() round trip after an upsert. Uses
+    INSERT ... RETURNING on SQLite 3.35+, and a follow-up SELECT on the
+    same connection otherwise.
+    
+    Args:
+        game: Dict with the same fields as upsert_game()
+        now: Timestamp for last_checked_at (defaults to SQLite's local now)
+    
+    Returns:
+        The game record as stored after the upsert
+    """
+    params = _game_params(game, now)
+    
+    conn = _get_connection()
     cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
+    if _HAS_RETURNING:
+        # A single statement commits atomically on its own
+        cursor.execute(_UPSERT_GAME_SQL + " RETURNING *", params)
+        row = cursor.fetchone()
+    else:
+        with _write_transaction(conn):
+            cursor.execute(_UPSERT_GAME_SQL, params)
+            cursor.execute(_SELECT_GAME_SQL, (params[0],))
+            row = cursor.fetchone()
+    
+    return dict(row)
+
+
+def _game_params(game: Dict[str, Any], now: Optional[str]) -> Tuple:
+    """Build the _UPSERT_GAME_SQL parameter tuple for a game dict."""
+    start_time_utc = game.get('start_time_utc')
+    start_time_local = game.get('start_time_local')
     
     # Convert UTC to local if local not provided but UTC is
     if start_time_local is None and start_time_utc is not None:
         start_time_local = utc_to_local(start_time_utc)
     
-    cursor.execute("""
-        INSERT INTO games (game_id, game_date, away_team, home_team, start_time_utc,
-                          start_time_local, status, away_score, home_score, last_checked_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(game_id) DO UPDATE SET
-            start_time_utc = COALESCE(excluded.start_time_utc, start_time_utc),
-            start_time_local = COALESCE(excluded.start_time_local, start_time_local),
-            status = COALESCE(excluded.status, status),
-            away_score = COALESCE(excluded.away_score, away_score),
-            home_score = COALESCE(excluded.home_score, home_score),
-            last_checked_at = excluded.last_checked_at
-    """, (game_id, game_date, away_team, home_team, start_time_utc,
-          start_time_local, status, away_score, home_score, now))
-    
-    conn.commit()
-    conn.close()
-    
-    return game_id
+    return (
+        game['game_id'],
+        game['game_date'],
+        game['away_team'],
+        game['home_team'],
+        start_time_utc,
+        start_time_local,
+        game.get('status', 'scheduled'),
+        game.get('away_score'),
+        game.get('home_score'),
+        now,
+    )
 
 
 def get_game(game_id: str) -> Optional[Dict[str, Any]]:
@@ -485,12 +996,11 @@ def get_game(game_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Game record or None
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
-    cursor.execute("SELECT * FROM games WHERE game_id = ?", (game_id,))
+    cursor.execute(_SELECT_GAME_SQL, (game_id,))
     row = cursor.fetchone()
-    conn.close()
     
     return dict(row) if row else None
 
@@ -505,8 +1015,9 @@ def get_games_for_date(game_date: str) -> List[Dict[str, Any]]:
     Returns:
         List of game records
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
+    cursor.row_factory = None
     
     cursor.execute("""
         SELECT * FROM games
@@ -514,10 +1025,7 @@ def get_games_for_date(game_date: str) -> List[Dict[str, Any]]:
         ORDER BY start_time_local, start_time_utc
     """, (game_date,))
     
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return _fetch_dicts(cursor)
 
 
 def update_game_score(
@@ -525,6 +1033,7 @@ def update_game_score(
     status: str,
     away_score: Optional[int],
     home_score: Optional[int],
+    now: Optional[str] = None,
 ):
     """
     Update a game's score and status.
@@ -534,20 +1043,35 @@ def update_game_score(
         status: New status (scheduled, in_progress, final)
         away_score: Away team score
         home_score: Home team score
+        now: Timestamp for last_checked_at (defaults to SQLite's local now)
     """
-    conn = connect()
-    cursor = conn.cursor()
+    update_game_scores([(game_id, status, away_score, home_score)], now)
+
+
+def update_game_scores(
+    rows: List[Tuple[str, str, Optional[int], Optional[int]]],
+    now: Optional[str] = None,
+) -> int:
+    """
+    Update scores and statuses for many games in one statement batch.
     
-    now = datetime.now().isoformat()
+    Args:
+        rows: List of (game_id, status, away_score, home_score) tuples
+        now: Timestamp for last_checked_at (defaults to SQLite's local now)
     
-    cursor.execute("""
-        UPDATE games
-        SET status = ?, away_score = ?, home_score = ?, last_checked_at = ?
-        WHERE game_id = ?
-    """, (status, away_score, home_score, now, game_id))
+    Returns:
+        Number of game rows updated
+    """
+    if not rows:
+        return 0
     
-    conn.commit()
-    conn.close()
+    conn = _get_connection()
+    
+    params = [(status, away_score, home_score, now, game_id)
+              for game_id, status, away_score, home_score in rows]
+    cursor = _execute_write(conn, _UPDATE_GAME_SCORE_SQL, params)
+    
+    return cursor.rowcount
 
 
 # ============================================================================
@@ -574,39 +1098,17 @@ def is_game_locked(slate_date: str, game_id: str, now_local: Optional[str] = Non
     if now_local is None:
         now_local = get_now_local()
     
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
-    # Check if already marked locked in daily_picks
-    cursor.execute("""
-        SELECT locked FROM daily_picks
-        WHERE slate_date = ? AND game_id = ?
-    """, (slate_date, game_id))
+    # Pick lock flag and game state in one round trip
+    cursor.execute(_SELECT_LOCK_STATE_SQL, (slate_date, game_id))
     row = cursor.fetchone()
     
-    if row and row['locked'] == 1:
-        conn.close()
+    if row['locked'] == 1:
         return True
     
-    # Check game status and start time
-    cursor.execute("""
-        SELECT start_time_local, status FROM games
-        WHERE game_id = ?
-    """, (game_id,))
-    game_row = cursor.fetchone()
-    conn.close()
-    
-    if game_row:
-        # Game is locked if in_progress or final
-        if game_row['status'] in ('in_progress', 'final'):
-            return True
-        
-        # Game is locked if start time has passed
-        start_time = game_row['start_time_local']
-        if start_time and now_local >= start_time:
-            return True
-    
-    return False
+    return _game_has_started(row['start_time_local'], row['status'], now_local)
 
 
 def lock_game_if_started(slate_date: str, game_id: str, now_local: Optional[str] = None) -> bool:
@@ -624,35 +1126,26 @@ def lock_game_if_started(slate_date: str, game_id: str, now_local: Optional[str]
     if now_local is None:
         now_local = get_now_local()
     
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
-    # Check game start time and status
-    cursor.execute("""
-        SELECT start_time_local, status FROM games
-        WHERE game_id = ?
-    """, (game_id,))
-    game_row = cursor.fetchone()
-    
-    should_lock = False
-    if game_row:
-        # Lock if in_progress or final
-        if game_row['status'] in ('in_progress', 'final'):
-            should_lock = True
-        # Lock if start time has passed
-        elif game_row['start_time_local'] and now_local >= game_row['start_time_local']:
-            should_lock = True
-    
-    if should_lock:
-        # Update the pick to be locked
-        cursor.execute("""
-            UPDATE daily_picks
-            SET locked = 1, locked_at = ?
-            WHERE slate_date = ? AND game_id = ? AND locked = 0
-        """, (now_local, slate_date, game_id))
-        conn.commit()
-    
-    conn.close()
+    with _write_transaction(conn):
+        # Check game start time and status
+        cursor.execute(_SELECT_GAME_STATE_SQL, (game_id,))
+        game_row = cursor.fetchone()
+        
+        should_lock = bool(game_row) and _game_has_started(
+            game_row['start_time_local'], game_row['status'], now_local
+        )
+        
+        if should_lock:
+            # Update the pick to be locked
+            cursor.execute("""
+                UPDATE daily_picks
+                SET locked = 1, locked_at = ?
+                WHERE slate_date = ? AND game_id = ? AND locked = 0
+            """, (now_local, slate_date, game_id))
+    
     return should_lock
 
 
@@ -670,40 +1163,23 @@ def lock_all_started_games(slate_date: str, now_local: Optional[str] = None) ->
     if now_local is None:
         now_local = get_now_local()
     
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
-    # Get all unlocked picks for this slate
+    # Lock every unlocked pick whose game is in progress, final, or past
+    # its start time in a single statement
     cursor.execute("""
-        SELECT dp.game_id, g.start_time_local, g.status
-        FROM daily_picks dp
-        JOIN games g ON dp.game_id = g.game_id
-        WHERE dp.slate_date = ? AND dp.locked = 0
-    """, (slate_date,))
-    
-    unlocked = cursor.fetchall()
-    locked_count = 0
-    
-    for row in unlocked:
-        should_lock = False
-        
-        # Lock if game status is in_progress or final
-        if row['status'] in ('in_progress', 'final'):
-            should_lock = True
-        # Lock if start time has passed
-        elif row['start_time_local'] and now_local >= row['start_time_local']:
-            should_lock = True
-        
-        if should_lock:
-            cursor.execute("""
-                UPDATE daily_picks
-                SET locked = 1, locked_at = ?
-                WHERE slate_date = ? AND game_id = ?
-            """, (now_local, slate_date, row['game_id']))
-            locked_count += 1
+        UPDATE daily_picks
+        SET locked = 1, locked_at = ?
+        WHERE slate_date = ? AND locked = 0
+          AND game_id IN (
+              SELECT game_id FROM games
+              WHERE status IN ('in_progress', 'final')
+                 OR (start_time_local <> '' AND start_time_local <= ?)
+          )
+    """, (now_local, slate_date, now_local))
     
-    conn.commit()
-    conn.close()
+    locked_count = cursor.rowcount
     
     return locked_count
 
@@ -730,93 +1206,72 @@ def upsert_daily_pick_if_unlocked(
     Returns:
         Tuple of (was_saved, is_locked)
     """
+    return upsert_daily_picks_bulk(slate_date, [(game_id, pick_data)], now_local)[0]
+
+
+def upsert_daily_picks_bulk(
+    slate_date: str,
+    picks: List[Tuple[str, Dict[str, Any]]],
+    now_local: Optional[str] = None,
+) -> List[Tuple[bool, bool]]:
+    """
+    Insert or update many daily picks in a single transaction, skipping locked ones.
+    
+    Picks for games that have started are not saved; an existing pick for
+    such a game is locked instead.
+    
+    Args:
+        slate_date: Date in YYYY-MM-DD format
+        picks: List of (game_id, pick_data) tuples
+        now_local: Current local time (ISO), defaults to now
+    
+    Returns:
+        List of (was_saved, is_locked) tuples, in input order
+    """
     if now_local is None:
         now_local = get_now_local()
     
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
-    # First, check if game has started and should be locked
-    cursor.execute("""
-        SELECT start_time_local, status FROM games
-        WHERE game_id = ?
-    """, (game_id,))
-    game_row = cursor.fetchone()
-    
-    game_started = False
-    if game_row:
-        if game_row['status'] in ('in_progress', 'final'):
-            game_started = True
-        elif game_row['start_time_local'] and now_local >= game_row['start_time_local']:
-            game_started = True
-    
-    # Check if pick already exists and is locked
-    cursor.execute("""
-        SELECT locked FROM daily_picks
-        WHERE slate_date = ? AND game_id = ?
-    """, (slate_date, game_id))
-    existing = cursor.fetchone()
+    results = []
+    to_lock = []
+    to_save = []
     
-    if existing and existing['locked'] == 1:
-        # Already locked, don't update
-        conn.close()
-        return (False, True)
+    game_ids = json.dumps([game_id for game_id, _ in picks])
     
-    if game_started:
-        # Game has started - lock the existing pick if there is one, don't save new one
-        if existing:
-            cursor.execute("""
-                UPDATE daily_picks
-                SET locked = 1, locked_at = ?
-                WHERE slate_date = ? AND game_id = ?
-            """, (now_local, slate_date, game_id))
-            conn.commit()
-        conn.close()
-        return (False, True)
+    # Hold the write lock from the checks through the writes so a concurrent
+    # run cannot lock or change a pick in between
+    with _write_transaction(conn):
+        # Lock flags and game states for every pick in one query
+        states = {
+            row['game_id']: row
+            for row in cursor.execute(_SELECT_LOCK_STATES_SQL, (game_ids, slate_date))
+        }
+        
+        for game_id, pick_data in picks:
+            state = states[game_id]
+            
+            if state['locked'] == 1:
+                # Already locked, don't update
+                results.append((False, True))
+            elif _game_has_started(state['start_time_local'], state['status'], now_local):
+                # Game has started - lock the existing pick if there is one, don't save new one
+                to_lock.append((now_local, slate_date, game_id))
+                results.append((False, True))
+            else:
+                # Game hasn't started - save/update the pick
+                to_save.append(
+                    (slate_date, game_id, *_pick_fields({**_PICK_FIELD_DEFAULTS, **pick_data}))
+                )
+                results.append((True, False))
+        
+        if to_lock:
+            cursor.executemany(_LOCK_PICK_SQL, to_lock)
+        if to_save:
+            cursor.executemany(_UPSERT_DAILY_PICK_SQL, to_save)
     
-    # Game hasn't started - save/update the pick
-    cursor.execute("""
-        INSERT INTO daily_picks (
-            slate_date, game_id, matchup, pick_team, pick_side,
-            conf_pct, bucket, pred_away_score, pred_home_score,
-            pred_total, range_low, range_high, internal_edge,
-            internal_margin, locked, result
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, 'PENDING')
-        ON CONFLICT(slate_date, game_id) DO UPDATE SET
-            matchup = excluded.matchup,
-            pick_team = excluded.pick_team,
-            pick_side = excluded.pick_side,
-            conf_pct = excluded.conf_pct,
-            bucket = excluded.bucket,
-            pred_away_score = excluded.pred_away_score,
-            pred_home_score = excluded.pred_home_score,
-            pred_total = excluded.pred_total,
-            range_low = excluded.range_low,
-            range_high = excluded.range_high,
-            internal_edge = excluded.internal_edge,
-            internal_margin = excluded.internal_margin
-        WHERE locked = 0
-    """, (
-        slate_date,
-        game_id,
-        pick_data.get('matchup', ''),
-        pick_data.get('pick_team', ''),
-        pick_data.get('pick_side', ''),
-        pick_data.get('conf_pct', 0),
-        pick_data.get('bucket', 'LOW'),
-        pick_data.get('pred_away_score'),
-        pick_data.get('pred_home_score'),
-        pick_data.get('pred_total'),
-        pick_data.get('range_low'),
-        pick_data.get('range_high'),
-        pick_data.get('internal_edge'),
-        pick_data.get('internal_margin'),
-    ))
-    
-    conn.commit()
-    conn.close()
-    
-    return (True, False)
+    return results
 
 
 def get_daily_picks(slate_date: str) -> List[Dict[str, Any]]:
@@ -829,8 +1284,9 @@ def get_daily_picks(slate_date: str) -> List[Dict[str, Any]]:
     Returns:
         List of pick records with game info
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
+    cursor.row_factory = None
     
     cursor.execute("""
         SELECT dp.*, g.away_team, g.home_team, g.status, 
@@ -841,10 +1297,7 @@ def get_daily_picks(slate_date: str) -> List[Dict[str, Any]]:
         ORDER BY dp.conf_pct DESC
     """, (slate_date,))
     
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return _fetch_dicts(cursor)
 
 
 def get_daily_pick(slate_date: str, game_id: str) -> Optional[Dict[str, Any]]:
@@ -858,24 +1311,37 @@ def get_daily_pick(slate_date: str, game_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Pick record or None
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT dp.*, g.away_team, g.home_team, g.status,
-               g.away_score, g.home_score, g.start_time_local
-        FROM daily_picks dp
-        JOIN games g ON dp.game_id = g.game_id
-        WHERE dp.slate_date = ? AND dp.game_id = ?
-    """, (slate_date, game_id))
+    cursor.execute(_SELECT_DAILY_PICK_SQL, (slate_date, game_id))
     
     row = cursor.fetchone()
-    conn.close()
     
     return dict(row) if row else None
 
 
-def grade_daily_pick(slate_date: str, game_id: str, result: str):
+def get_daily_picks_by_ids(slate_date: str, game_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get several picks from one slate in a single query.
+    
+    Args:
+        slate_date: Date in YYYY-MM-DD format
+        game_ids: Game identifiers to look up
+    
+    Returns:
+        Dict mapping game_id to pick record; games without a pick are omitted
+    """
+    conn = _get_connection()
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    
+    cursor.execute(_SELECT_DAILY_PICKS_BY_IDS_SQL, (slate_date, json.dumps(game_ids)))
+    
+    return {row['game_id']: row for row in _fetch_dicts(cursor)}
+
+
+def grade_daily_pick(slate_date: str, game_id: str, result: str, now: Optional[str] = None):
     """
     Grade a daily pick as W or L.
     
@@ -883,21 +1349,35 @@ def grade_daily_pick(slate_date: str, game_id: str, result: str):
         slate_date: Date in YYYY-MM-DD format
         game_id: Game identifier
         result: "W" or "L"
+        now: Timestamp for graded_at (defaults to SQLite's local now)
     """
-    conn = connect()
-    cursor = conn.cursor()
+    grade_daily_picks_bulk([(slate_date, game_id, result)], now)
+
+
+def grade_daily_picks_bulk(
+    grades: List[Tuple[str, str, str]],
+    now: Optional[str] = None,
+) -> int:
+    """
+    Grade many daily picks in a single transaction.
     
-    now = datetime.now().isoformat()
+    Args:
+        grades: List of (slate_date, game_id, result) tuples
+        now: Timestamp for graded_at (defaults to SQLite's local now)
     
-    # Also ensure it's locked when graded
-    cursor.execute("""
-        UPDATE daily_picks
-        SET result = ?, graded_at = ?, locked = 1, locked_at = COALESCE(locked_at, ?)
-        WHERE slate_date = ? AND game_id = ?
-    """, (result, now, now, slate_date, game_id))
+    Returns:
+        Number of pick rows updated
+    """
+    if not grades:
+        return 0
+    
+    conn = _get_connection()
+    
+    params = [(result, now, now, slate_date, game_id)
+              for slate_date, game_id, result in grades]
+    cursor = _execute_write(conn, _GRADE_DAILY_PICK_SQL, params)
     
-    conn.commit()
-    conn.close()
+    return cursor.rowcount
 
 
 def get_ungraded_daily_picks(slate_date: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -910,32 +1390,30 @@ def get_ungraded_daily_picks(slate_date: Optional[str] = None) -> List[Dict[str,
     Returns:
         List of ungraded pick records with game info
     """
-    conn = connect()
-    cursor = conn.cursor()
+    return list(iter_ungraded_daily_picks(slate_date))
+
+
+def iter_ungraded_daily_picks(slate_date: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream daily picks that haven't been graded yet.
     
-    if slate_date:
-        cursor.execute("""
-            SELECT dp.*, g.away_team, g.home_team, g.status, 
-                   g.away_score, g.home_score, g.start_time_local
-            FROM daily_picks dp
-            JOIN games g ON dp.game_id = g.game_id
-            WHERE dp.result = 'PENDING' AND dp.slate_date = ?
-            ORDER BY dp.conf_pct DESC
-        """, (slate_date,))
-    else:
-        cursor.execute("""
-            SELECT dp.*, g.away_team, g.home_team, g.status,
-                   g.away_score, g.home_score, g.start_time_local
-            FROM daily_picks dp
-            JOIN games g ON dp.game_id = g.game_id
-            WHERE dp.result = 'PENDING'
-            ORDER BY dp.slate_date DESC, dp.conf_pct DESC
-        """)
+    Same rows and order as get_ungraded_daily_picks(), but fetched in
+    chunks rather than materialized up front. Finish iterating before
+    writing to daily_picks on the same thread.
     
-    rows = cursor.fetchall()
-    conn.close()
+    Args:
+        slate_date: Optional date filter (YYYY-MM-DD)
+    
+    Yields:
+        Ungraded pick records with game info
+    """
+    conn = _get_connection()
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    
+    cursor.execute(_SELECT_UNGRADED_DAILY_PICKS_SQL, (slate_date or None,))
     
-    return [dict(row) for row in rows]
+    yield from _iter_dicts(cursor)
 
 
 # ============================================================================
@@ -946,102 +1424,89 @@ def compute_stats() -> WinrateStats:
     """
     Compute win rate statistics from the database.
     
-    Uses daily_picks table for stats.
+    Uses daily_picks table for stats. All counts are derived from a single
+    GROUP BY scan over (bucket, result) rather than one query per field.
     
     Returns:
         WinrateStats object with overall and per-bucket stats
     """
-    stats = WinrateStats()
-    
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
+    # Plain tuples - no need for sqlite3.Row objects for scalar counts
+    cursor.row_factory = None
     
-    # Overall stats from daily_picks
-    cursor.execute("SELECT COUNT(*) FROM daily_picks")
-    stats.total_picks = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE result IN ('W', 'L')")
-    stats.total_graded = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE result = 'W'")
-    stats.wins = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE result = 'L'")
-    stats.losses = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE result = 'PENDING' OR result IS NULL")
-    stats.pending = cursor.fetchone()[0]
-    
-    if stats.total_graded > 0:
-        stats.win_pct = (stats.wins / stats.total_graded) * 100
-    
-    # HIGH bucket
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'HIGH'")
-    stats.high_total = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'HIGH' AND result IN ('W', 'L')")
-    stats.high_graded = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'HIGH' AND result = 'W'")
-    stats.high_wins = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'HIGH' AND result = 'L'")
-    stats.high_losses = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'HIGH' AND (result = 'PENDING' OR result IS NULL)")
-    stats.high_pending = cursor.fetchone()[0]
-    
-    if stats.high_graded > 0:
-        stats.high_win_pct = (stats.high_wins / stats.high_graded) * 100
-    
-    # MEDIUM bucket
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'MEDIUM'")
-    stats.med_total = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'MEDIUM' AND result IN ('W', 'L')")
-    stats.med_graded = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'MEDIUM' AND result = 'W'")
-    stats.med_wins = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'MEDIUM' AND result = 'L'")
-    stats.med_losses = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'MEDIUM' AND (result = 'PENDING' OR result IS NULL)")
-    stats.med_pending = cursor.fetchone()[0]
-    
-    if stats.med_graded > 0:
-        stats.med_win_pct = (stats.med_wins / stats.med_graded) * 100
-    
-    # LOW bucket
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'LOW'")
-    stats.low_total = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'LOW' AND result IN ('W', 'L')")
-    stats.low_graded = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'LOW' AND result = 'W'")
-    stats.low_wins = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'LOW' AND result = 'L'")
-    stats.low_losses = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM daily_picks WHERE bucket = 'LOW' AND (result = 'PENDING' OR result IS NULL)")
-    stats.low_pending = cursor.fetchone()[0]
-    
-    if stats.low_graded > 0:
-        stats.low_win_pct = (stats.low_wins / stats.low_graded) * 100
-    
-    conn.close()
+    # Group on the raw columns so the scan can use idx_daily_picks_bucket_result
+    # in order; NULL results are folded into PENDING below
+    cursor.execute("""
+        SELECT bucket, result, COUNT(*)
+        FROM daily_picks
+        GROUP BY bucket, result
+    """)
+    counts = {}
+    for bucket, result, count in cursor:
+        key = (bucket, 'PENDING' if result is None else result)
+        counts[key] = counts.get(key, 0) + count
+    
+    def tally(bucket: Optional[str] = None) -> Tuple[int, int, int, int]:
+        """Return (total, wins, losses, pending) for a bucket (or all buckets)."""
+        total = wins = losses = pending = 0
+        for (b, result), count in counts.items():
+            if bucket is not None and b != bucket:
+                continue
+            total += count
+            if result == 'W':
+                wins += count
+            elif result == 'L':
+                losses += count
+            elif result == 'PENDING':
+                pending += count
+        return total, wins, losses, pending
+    
+    def win_pct(wins: int, graded: int) -> float:
+        """Return the win percentage, or 0.0 when nothing is graded yet."""
+        return (wins / graded) * 100 if graded > 0 else 0.0
     
-    return stats
+    # Overall stats from daily_picks
+    total, wins, losses, pending = tally()
+    kw = {
+        'total_picks': total,
+        'total_graded': wins + losses,
+        'wins': wins,
+        'losses': losses,
+        'win_pct': win_pct(wins, wins + losses),
+        'pending': pending,
+    }
+    
+    # Per-bucket stats, built into the same constructor call
+    for prefix, bucket in (('high', 'HIGH'), ('med', 'MEDIUM'), ('low', 'LOW')):
+        total, wins, losses, pending = tally(bucket)
+        kw[f'{prefix}_total'] = total
+        kw[f'{prefix}_graded'] = wins + losses
+        kw[f'{prefix}_wins'] = wins
+        kw[f'{prefix}_losses'] = losses
+        kw[f'{prefix}_win_pct'] = win_pct(wins, wins + losses)
+        kw[f'{prefix}_pending'] = pending
+    
+    return WinrateStats(**kw)
 
 
 # ============================================================================
 # EXPORT
 # ============================================================================
 
-def export_to_csv(filepath: str, start_date: Optional[str] = None, end_date: Optional[str] = None):
+# Rows fetched per round trip when streaming an export
+EXPORT_CHUNK_SIZE = 1000
+
+# Write buffer for the export file (1 MiB), so large exports make few write() calls
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def export_to_csv(
+    filepath: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    include_run_timestamp: bool = True,
+):
     """
     Export picks to a CSV file.
     
@@ -1049,20 +1514,39 @@ def export_to_csv(filepath: str, start_date: Optional[str] = None, end_date: Opt
         filepath: Path to output CSV file
         start_date: Optional start date filter (YYYY-MM-DD)
         end_date: Optional end date filter (YYYY-MM-DD)
+        include_run_timestamp: Include the Run_Timestamp column. Leaving it
+            out also drops the join against daily_slates.
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
-    
+    # Plain tuples are all csv.writer needs
+    cursor.row_factory = None
+    
+    header = [
+        'Date', 'Away', 'Home', 'Pick', 'Side', 'Conf%', 'Bucket',
+        'Pred_Away', 'Pred_Home', 'Pred_Total', 'Actual_Away', 'Actual_Home',
+        'Result', 'Locked',
+    ]
     query = """
         SELECT dp.slate_date, g.away_team, g.home_team, dp.pick_team, dp.pick_side,
                dp.conf_pct, dp.bucket, dp.pred_away_score, dp.pred_home_score,
                dp.pred_total, g.away_score as actual_away, g.home_score as actual_home,
-               dp.result, dp.locked, ds.last_run_at as run_timestamp
-        FROM daily_picks dp
-        JOIN games g ON dp.game_id = g.game_id
-        LEFT JOIN daily_slates ds ON dp.slate_date = ds.slate_date
+               dp.result, dp.locked
     """
     
+    if include_run_timestamp:
+        header.append('Run_Timestamp')
+        query += """, ds.last_run_at as run_timestamp
+            FROM daily_picks dp
+            JOIN games g ON dp.game_id = g.game_id
+            LEFT JOIN daily_slates ds ON dp.slate_date = ds.slate_date
+        """
+    else:
+        query += """
+            FROM daily_picks dp
+            JOIN games g ON dp.game_id = g.game_id
+        """
+    
     params = []
     conditions = []
     
@@ -1078,25 +1562,22 @@ def export_to_csv(filepath: str, start_date: Optional[str] = None, end_date: Opt
     
     query += " ORDER BY dp.slate_date DESC, dp.conf_pct DESC"
     
+    cursor.arraysize = EXPORT_CHUNK_SIZE
     cursor.execute(query, params)
-    rows = cursor.fetchall()
-    
-    conn.close()
     
-    # Write to CSV
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+    # Write to CSV, streaming rows in chunks rather than loading them all
+    with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         
         # Header
-        writer.writerow([
-            'Date', 'Away', 'Home', 'Pick', 'Side', 'Conf%', 'Bucket',
-            'Pred_Away', 'Pred_Home', 'Pred_Total', 'Actual_Away', 'Actual_Home',
-            'Result', 'Locked', 'Run_Timestamp'
-        ])
+        writer.writerow(header)
         
         # Data
-        for row in rows:
-            writer.writerow(list(row))
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            writer.writerows(rows)
 
 
 # ============================================================================
@@ -1119,19 +1600,15 @@ def insert_run(
     Returns:
         The generated run_id
     """
-    conn = connect()
+    conn = _get_connection()
     cursor = conn.cursor()
     
     run_id = str(uuid4())
-    created_at = datetime.now().isoformat()
     
     cursor.execute("""
         INSERT INTO runs (run_id, run_date, created_at, model_version, notes)
-        VALUES (?, ?, ?, ?, ?)
-    """, (run_id, run_date, created_at, model_version, notes))
-    
-    conn.commit()
-    conn.close()
+        VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'), ?, ?)
+    """, (run_id, run_date, model_version, notes))
     
     return run_id
 
@@ -1157,28 +1634,34 @@ def upsert_pick(
     """
     Insert or update a pick record (legacy compatibility).
     """
-    conn = connect()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        INSERT INTO picks (pick_id, run_id, game_id, matchup, pick_team, pick_side,
-                          conf_pct, bucket, pred_away_score, pred_home_score,
-                          pred_total, range_low, range_high, internal_edge,
-                          internal_margin, result)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(pick_id) DO UPDATE SET
-            result = excluded.result
-    """, (pick_id, run_id, game_id, matchup, pick_team, pick_side,
-          conf_pct, bucket, pred_away_score, pred_home_score,
-          pred_total, range_low, range_high, internal_edge,
-          internal_margin, result))
-    
-    conn.commit()
-    conn.close()
+    upsert_picks_bulk([(pick_id, run_id, game_id, matchup, pick_team, pick_side,
+                        conf_pct, bucket, pred_away_score, pred_home_score,
+                        pred_total, range_low, range_high, internal_edge,
+                        internal_margin, result)])
     
     return pick_id
 
 
+def upsert_picks_bulk(rows: List[Tuple]) -> List[str]:
+    """
+    Insert or update many pick records in a single transaction (legacy compatibility).
+    
+    Args:
+        rows: List of tuples with the 16 upsert_pick() arguments, in order
+    
+    Returns:
+        List of pick_ids, in input order
+    """
+    if not rows:
+        return []
+    
+    conn = _get_connection()
+    
+    _execute_write(conn, _UPSERT_PICK_SQL, rows)
+    
+    return [row[0] for row in rows]
+
+
 def get_ungraded_picks(game_date: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get ungraded picks (legacy compatibility - redirects to daily_picks)."""
     return get_ungraded_daily_picks(game_date)
@@ -1186,24 +1669,34 @@ def get_ungraded_picks(game_date: Optional[str] = None) -> List[Dict[str, Any]]:
 
 def grade_pick(pick_id: str, result: str):
     """Grade a pick (legacy compatibility)."""
-    conn = connect()
-    cursor = conn.cursor()
+    grade_picks_bulk([(pick_id, result)])
+
+
+def grade_picks_bulk(pairs: List[Tuple[str, str]]) -> int:
+    """
+    Grade many picks in a single transaction (legacy compatibility).
     
-    now = datetime.now().isoformat()
+    Args:
+        pairs: List of (pick_id, result) tuples
     
-    cursor.execute("""
-        UPDATE picks
-        SET result = ?, graded_at = ?
-        WHERE pick_id = ?
-    """, (result, now, pick_id))
+    Returns:
+        Number of pick rows updated
+    """
+    if not pairs:
+        return 0
+    
+    conn = _get_connection()
+    
+    params = [(result, pick_id) for pick_id, result in pairs]
+    cursor = _execute_write(conn, _GRADE_PICK_SQL, params)
     
-    conn.commit()
-    conn.close()
+    return cursor.rowcount
 
 
 # ============================================================================
 # INITIALIZATION
 # ============================================================================
 
-# Initialize database on module import
-init_db()
+# The schema is created lazily by the first connect(), so importing this
+# module doesn't touch the database file
+atexit.register(_close_all)
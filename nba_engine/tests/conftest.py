@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for the NBA engine tests.
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _block_network():
+    """
+    Refuse real HTTP requests for the whole session.
+    
+    Installed once at the transport adapter, so a drifted patch target in a
+    test fails fast with ConnectionError instead of reaching the network.
+    Tests that need a response patch HTTPAdapter.send themselves.
+    """
+    import requests
+    
+    def refuse(adapter, request, **kwargs):
+        raise requests.ConnectionError(f"network access disabled in tests: {request.url}")
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(requests.adapters.HTTPAdapter, "send", refuse)
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _worker_db(tmp_path_factory):
+    """
+    Point storage at a throwaway SQLite file for the session.
+    
+    Each pytest-xdist worker gets its own file, so database tests never
+    contend for a lock (or touch the real database) under -n auto.
+    """
+    from storage.db import _reset_for_tests
+    
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    db_path = tmp_path_factory.mktemp(f"db-{worker}") / "test.db"
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("NBA_DB_PATH", str(db_path))
+        _reset_for_tests()
+        yield db_path
+    _reset_for_tests()
+
+
+@pytest.fixture(scope="session")
+def paths_mod():
+    """The paths module, imported once for the whole session."""
+    import paths
+    return paths
+
+
+@pytest.fixture(scope="module")
+def fallback_teams():
+    """Fallback TeamStrength records by team abbreviation, built once per module."""
+    from ingest.team_stats import get_fallback_team_strength
+    return get_fallback_team_strength()
+
+
+@pytest.fixture(scope="module")
+def fallback_team_dicts(fallback_teams):
+    """The fallback TeamStrength records serialized with to_dict()."""
+    return {team: strength.to_dict() for team, strength in fallback_teams.items()}
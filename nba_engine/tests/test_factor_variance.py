@@ -19,60 +19,38 @@ from model.factor_debug import (
     validate_distinct_stats, ensure_distinct_copies,
     DataSource, StatsWithProvenance,
 )
-from ingest.team_stats import get_fallback_team_strength, TeamStrength, FALLBACK_TEAM_DATA
+from ingest.team_stats import TeamStrength, FALLBACK_TEAM_DATA
 
 
 class TestFallbackDataVariance:
     """Test that fallback data has proper per-team variation."""
     
-    def test_fallback_data_has_all_teams(self):
+    def test_fallback_data_has_all_teams(self, fallback_teams):
         """Verify fallback data includes expected teams."""
-        teams = get_fallback_team_strength()
-        assert len(teams) >= 25, f"Expected at least 25 teams, got {len(teams)}"
+        assert len(fallback_teams) >= 25, f"Expected at least 25 teams, got {len(fallback_teams)}"
         
         # Check some specific teams exist
         expected_teams = ['OKC', 'CLE', 'BOS', 'NYK', 'LAL', 'GSW', 'MIA', 'PHX']
         for team in expected_teams:
-            assert team in teams, f"Team {team} missing from fallback data"
+            assert team in fallback_teams, f"Team {team} missing from fallback data"
     
-    def test_fallback_efg_has_variance(self):
-        """Verify eFG% varies across teams."""
-        teams = get_fallback_team_strength()
-        efg_values = [ts.efg_pct for ts in teams.values()]
-        
-        assert len(set(efg_values)) > 1, "All teams have identical eFG%!"
-        assert max(efg_values) - min(efg_values) > 0.01, "eFG% spread too small"
-    
-    def test_fallback_tov_has_variance(self):
-        """Verify TOV% varies across teams."""
-        teams = get_fallback_team_strength()
-        tov_values = [ts.tov_pct for ts in teams.values()]
-        
-        assert len(set(tov_values)) > 1, "All teams have identical TOV%!"
-        assert max(tov_values) - min(tov_values) > 1.0, "TOV% spread too small"
-    
-    def test_fallback_oreb_has_variance(self):
-        """Verify OREB% varies across teams."""
-        teams = get_fallback_team_strength()
-        oreb_values = [ts.oreb_pct for ts in teams.values()]
-        
-        assert len(set(oreb_values)) > 1, "All teams have identical OREB%!"
-        assert max(oreb_values) - min(oreb_values) > 1.0, "OREB% spread too small"
+    @pytest.mark.parametrize("attr,label,min_spread", [
+        ("efg_pct", "eFG%", 0.01),
+        ("tov_pct", "TOV%", 1.0),
+        ("oreb_pct", "OREB%", 1.0),
+        ("pace", "pace", 1.0),
+    ])
+    def test_fallback_attr_has_variance(self, fallback_teams, attr, label, min_spread):
+        """Verify each stat varies across teams."""
+        values = [getattr(ts, attr) for ts in fallback_teams.values()]
+        
+        assert len(set(values)) > 1, f"All teams have identical {label}!"
+        assert max(values) - min(values) > min_spread, f"{label} spread too small"
     
-    def test_fallback_pace_has_variance(self):
-        """Verify pace varies across teams."""
-        teams = get_fallback_team_strength()
-        pace_values = [ts.pace for ts in teams.values()]
-        
-        assert len(set(pace_values)) > 1, "All teams have identical pace!"
-        assert max(pace_values) - min(pace_values) > 1.0, "Pace spread too small"
-    
-    def test_two_different_teams_have_different_stats(self):
+    def test_two_different_teams_have_different_stats(self, fallback_teams):
         """Verify two specific teams have different stats."""
-        teams = get_fallback_team_strength()
-        
-        okc = teams.get('OKC')
-        was = teams.get('WAS')
+        okc = fallback_teams.get('OKC')
+        was = fallback_teams.get('WAS')
         
         assert okc is not None and was is not None
         
@@ -82,6 +60,21 @@ class TestFallbackDataVariance:
         assert okc.net_rating != was.net_rating, "OKC and WAS have same net rating"
 
 
+@pytest.fixture(scope="module")
+def small_original():
+    """A small stats-like dict with one nested level."""
+    return {'a': 1, 'b': {'nested': 2}}
+
+
+@pytest.fixture(scope="module")
+def sample_stats():
+    """A league-average stats dict; tests copy it before changing anything."""
+    return {'efg_pct': 0.52, 'tov_pct': 14.0, 'oreb_pct': 25.0,
+            'pace': 100.0, 'ft_rate': 0.25, 'fg3_pct': 0.36,
+            'fg3a_rate': 0.40, 'opp_efg_pct': 0.52, 'off_rating': 110,
+            'def_rating': 110, 'net_rating': 0}
+
+
 class TestDistinctStatsValidation:
     """Test stats validation and distinct copies."""
     
@@ -94,21 +87,18 @@ class TestDistinctStatsValidation:
         assert len(warnings) > 0, "Should warn about same object"
         assert any("SAME OBJECT" in w for w in warnings)
     
-    def test_validate_mostly_identical_values(self):
+    def test_validate_mostly_identical_values(self, sample_stats):
         """Validation should warn about mostly identical values."""
-        home_stats = {'efg_pct': 0.52, 'tov_pct': 14.0, 'oreb_pct': 25.0, 
-                      'pace': 100.0, 'ft_rate': 0.25, 'fg3_pct': 0.36,
-                      'fg3a_rate': 0.40, 'opp_efg_pct': 0.52, 'off_rating': 110,
-                      'def_rating': 110, 'net_rating': 0}
-        away_stats = home_stats.copy()  # Copy but same values
+        home_stats = sample_stats
+        away_stats = sample_stats.copy()  # Copy but same values
         
         warnings = validate_distinct_stats("NYK", "BOS", home_stats, away_stats)
         
         assert len(warnings) > 0, "Should warn about identical values"
     
-    def test_ensure_distinct_copies(self):
+    def test_ensure_distinct_copies(self, small_original):
         """ensure_distinct_copies should create independent copies."""
-        original = {'a': 1, 'b': {'nested': 2}}
+        original = small_original
         
         copy1, copy2 = ensure_distinct_copies(original, original)
         
@@ -122,6 +112,17 @@ class TestDistinctStatsValidation:
         
         assert copy2['a'] == 1
         assert copy2['b']['nested'] == 2
+        assert original['b']['nested'] == 2
+    
+    def test_ensure_distinct_copies_nested_list(self, small_original):
+        """Lists inside the stats should be copied too."""
+        original = {**small_original, 'c': [1, 2]}
+        
+        copy1, copy2 = ensure_distinct_copies(original, original)
+        copy1['c'].append(3)
+        
+        assert copy2['c'] == [1, 2]
+        assert original['c'] == [1, 2]
 
 
 class TestFactorCalculations:
@@ -166,61 +167,76 @@ class TestFactorCalculations:
         assert result1.away_raw == 98.0
 
 
+@pytest.fixture(scope="module")
+def okc_vs_was(fallback_team_dicts):
+    """OKC hosting WAS, scored once per module."""
+    return score_game_v3(
+        home_team='OKC',
+        away_team='WAS',
+        home_strength=None,
+        away_strength=None,
+        home_stats=fallback_team_dicts['OKC'],
+        away_stats=fallback_team_dicts['WAS'],
+    )
+
+
+@pytest.fixture(scope="module")
+def was_vs_okc(fallback_team_dicts):
+    """WAS hosting OKC (the reverse matchup), scored once per module."""
+    return score_game_v3(
+        home_team='WAS',
+        away_team='OKC',
+        home_strength=None,
+        away_strength=None,
+        home_stats=fallback_team_dicts['WAS'],
+        away_stats=fallback_team_dicts['OKC'],
+    )
+
+
+@pytest.fixture(scope="module")
+def bos_vs_cha(fallback_team_dicts):
+    """BOS hosting CHA, scored once per module."""
+    return score_game_v3(
+        home_team='BOS',
+        away_team='CHA',
+        home_strength=None,
+        away_strength=None,
+        home_stats=fallback_team_dicts['BOS'],
+        away_stats=fallback_team_dicts['CHA'],
+    )
+
+
+@pytest.fixture(scope="module")
+def nyk_shared(fallback_team_dicts):
+    """NYK hosting BOS with the same stats object passed for both sides."""
+    # Intentionally pass same object (bug scenario)
+    shared_stats = fallback_team_dicts['NYK']
+    return score_game_v3(
+        home_team='NYK',
+        away_team='BOS',
+        home_strength=None,
+        away_strength=None,
+        home_stats=shared_stats,
+        away_stats=shared_stats,  # Same object!
+    )
+
+
+@pytest.mark.slow
 class TestScoreGameV3Integration:
     """Integration tests for score_game_v3."""
     
-    def test_score_game_with_distinct_teams(self):
+    def test_score_game_with_distinct_teams(self, okc_vs_was, was_vs_okc):
         """Scoring should produce different results for different team matchups."""
-        teams = get_fallback_team_strength()
-        
-        okc_stats = teams['OKC'].to_dict()
-        was_stats = teams['WAS'].to_dict()
-        bos_stats = teams['BOS'].to_dict()
-        
-        # OKC vs WAS
-        score1 = score_game_v3(
-            home_team='OKC',
-            away_team='WAS',
-            home_strength=None,
-            away_strength=None,
-            home_stats=okc_stats,
-            away_stats=was_stats,
-        )
-        
-        # WAS vs OKC (reversed)
-        score2 = score_game_v3(
-            home_team='WAS',
-            away_team='OKC',
-            home_strength=None,
-            away_strength=None,
-            home_stats=was_stats,
-            away_stats=okc_stats,
-        )
-        
         # Results should be different (home team changed)
-        assert score1.edge_score_total != score2.edge_score_total
+        assert okc_vs_was.edge_score_total != was_vs_okc.edge_score_total
         
         # OKC at home vs WAS should favor OKC
-        assert score1.predicted_winner == 'OKC', "OKC should be favored at home vs WAS"
+        assert okc_vs_was.predicted_winner == 'OKC', "OKC should be favored at home vs WAS"
     
-    def test_score_game_factors_have_variance(self):
+    def test_score_game_factors_have_variance(self, bos_vs_cha):
         """Factors in a game should not all be identical."""
-        teams = get_fallback_team_strength()
-        
-        home_stats = teams['BOS'].to_dict()
-        away_stats = teams['CHA'].to_dict()
-        
-        score = score_game_v3(
-            home_team='BOS',
-            away_team='CHA',
-            home_strength=None,
-            away_strength=None,
-            home_stats=home_stats,
-            away_stats=away_stats,
-        )
-        
         # Check factors with raw values
-        factors_with_raw = [f for f in score.factors 
+        factors_with_raw = [f for f in bos_vs_cha.factors 
                           if hasattr(f, 'home_raw') and f.home_raw != 0]
         
         # Count identical factors
@@ -232,27 +248,13 @@ class TestScoreGameV3Integration:
         pct_identical = identical / len(factors_with_raw) * 100
         assert pct_identical < 50, f"Too many identical factors: {pct_identical:.0f}%"
     
-    def test_score_game_ensures_distinct_stats(self):
+    def test_score_game_ensures_distinct_stats(self, nyk_shared):
         """score_game_v3 should handle same object input safely."""
-        teams = get_fallback_team_strength()
-        
-        # Intentionally pass same object (bug scenario)
-        shared_stats = teams['NYK'].to_dict()
-        
-        # This should NOT crash and should make copies internally
-        score = score_game_v3(
-            home_team='NYK',
-            away_team='BOS',
-            home_strength=None,
-            away_strength=None,
-            home_stats=shared_stats,
-            away_stats=shared_stats,  # Same object!
-        )
-        
+        # The shared input should NOT crash; copies are made internally.
         # Should still produce a result (even if suboptimal)
-        assert score is not None
-        assert score.home_team == 'NYK'
-        assert score.away_team == 'BOS'
+        assert nyk_shared is not None
+        assert nyk_shared.home_team == 'NYK'
+        assert nyk_shared.away_team == 'BOS'
 
 
 class TestSafeGetWithFallback:
@@ -0,0 +1,65 @@
+"""
+Tests for the paths module that reload it or patch interpreter state.
+
+Kept apart from test_paths.py so the module reload and the sys.frozen
+patching can't disturb the session-cached paths module the other tests
+use. Every reload is undone before the test ends, so these tests can run
+on any pytest-xdist worker.
+"""
+
+import importlib
+import sys
+from unittest import mock
+
+import pytest
+
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture
+def isolated_paths(paths_mod, tmp_path, monkeypatch):
+    """The paths module reloaded with its data root under tmp_path."""
+    monkeypatch.setenv('NBA_ENGINE_DATA_ROOT', str(tmp_path / 'NBA_Engine'))
+    importlib.reload(paths_mod)
+    yield paths_mod
+    monkeypatch.undo()
+    importlib.reload(paths_mod)
+
+
+def test_import_creates_directories(isolated_paths, tmp_path):
+    """Importing paths module should create necessary directories."""
+    assert isolated_paths.DATA_ROOT == tmp_path / 'NBA_Engine'
+    assert isolated_paths.DATA_ROOT.exists()
+    assert isolated_paths.TRACKING_DIR.exists()
+    assert isolated_paths.LOG_DIR.exists()
+    assert isolated_paths.CACHE_DIR.exists()
+
+
+def test_data_root_is_stable(paths_mod):
+    """DATA_ROOT should be the same after the module is reloaded."""
+    data_root = paths_mod.DATA_ROOT
+    importlib.reload(paths_mod)
+    
+    assert paths_mod.DATA_ROOT == data_root
+
+
+class TestFrozenSimulation:
+    """Test behavior when simulating frozen (PyInstaller) mode."""
+    
+    def test_would_not_use_meipass_for_storage(self):
+        """Even if _MEIPASS exists, storage should not use it."""
+        from paths import get_data_root
+        
+        # Simulate frozen mode
+        with mock.patch.object(sys, 'frozen', True, create=True):
+            with mock.patch.object(sys, '_MEIPASS', '/tmp/_MEI12345', create=True):
+                root = get_data_root()
+                
+                # Should NOT contain _MEI
+                assert '_MEI' not in str(root)
+                assert '/tmp/' not in str(root) or '.local' in str(root)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
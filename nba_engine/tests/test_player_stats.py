@@ -0,0 +1,35 @@
+"""Unit tests for player_stats team resolution."""
+
+import pytest
+
+from ingest.player_stats import TEAM_ID_TO_ABBREV, _resolve_abbrev
+
+
+ABBREV_TO_TEAM_ID = {v: k for k, v in TEAM_ID_TO_ABBREV.items()}
+BOS_ID = ABBREV_TO_TEAM_ID["BOS"]
+
+
+@pytest.mark.parametrize("row, expected", [
+    pytest.param({"TEAM_ID": BOS_ID}, "BOS", id="int_id"),
+    pytest.param({"TEAM_ID": float(BOS_ID)}, "BOS", id="float_id"),
+    pytest.param({"TEAM_ID": str(BOS_ID)}, "BOS", id="string_id"),
+    pytest.param({"TEAM_ID": 1}, None, id="unmapped_id"),
+    pytest.param({"TEAM_ID": None}, None, id="missing_id"),
+    pytest.param({"TEAM_ID": "n/a"}, None, id="garbage_id"),
+    pytest.param({"TEAM_ID": float("inf")}, None, id="inf_id"),
+    pytest.param({"TEAM_ID": "-inf"}, None, id="negative_inf_id"),
+    pytest.param({"TEAM_ID": float("nan")}, None, id="nan_id"),
+])
+def test_resolve_abbrev(row, expected):
+    """_resolve_abbrev should map int, float and numeric-string TEAM_IDs and return None for anything unmappable."""
+    assert _resolve_abbrev(row) == expected
+
+
+def test_every_team_id_round_trips():
+    """Every known TEAM_ID should resolve back to its abbreviation."""
+    for abbrev, team_id in ABBREV_TO_TEAM_ID.items():
+        assert _resolve_abbrev({"TEAM_ID": team_id}) == abbrev
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -1,12 +1,14 @@
 """Unit tests for rotation_replacement module."""
 
+import functools
+
 import pytest
 from dataclasses import dataclass
 from typing import Optional
 
 
-# Mock player class for testing
-@dataclass
+# Mock player class for testing (frozen so rosters can key the tier cache)
+@dataclass(slots=True, frozen=True)
 class MockPlayer:
     player_name: str
     points_per_game: float
@@ -16,7 +18,7 @@ class MockPlayer:
 
 
 # Import functions to test
-from model.star_impact import select_star_tiers
+from model.star_impact import select_star_tiers, compute_star_factor
 from model.rotation_replacement import (
     star_absent,
     get_absent_stars,
@@ -26,6 +28,17 @@ from model.rotation_replacement import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def cached_tiers(roster: tuple) -> dict:
+    """select_star_tiers() memoized on the (hashable) roster."""
+    return select_star_tiers(list(roster))
+
+
+def tiers_for(players: list) -> dict:
+    """Star tiers for a roster, computed once per distinct roster."""
+    return cached_tiers(tuple(players))
+
+
 class TestStarAbsent:
     """Tests for star_absent function."""
     
@@ -35,7 +48,7 @@ class TestStarAbsent:
             MockPlayer("Star1", 30.0, 10.0, 35.0, "Available"),
             MockPlayer("Star2", 25.0, 8.0, 34.0, "Available"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         assert star_absent(tiers) == False
     
@@ -45,7 +58,7 @@ class TestStarAbsent:
             MockPlayer("Star1", 30.0, 10.0, 35.0, "OUT"),
             MockPlayer("Star2", 25.0, 8.0, 34.0, "Available"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         assert star_absent(tiers) == True
     
@@ -55,7 +68,7 @@ class TestStarAbsent:
             MockPlayer("Star1", 30.0, 10.0, 35.0, "Doubtful"),
             MockPlayer("Star2", 25.0, 8.0, 34.0, "Available"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         assert star_absent(tiers) == True
     
@@ -65,7 +78,7 @@ class TestStarAbsent:
             MockPlayer("Star1", 30.0, 10.0, 35.0, "Questionable"),
             MockPlayer("Star2", 25.0, 8.0, 34.0, "Available"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         # Questionable has mult 0.60 > 0.25, so not considered absent
         assert star_absent(tiers) == False
@@ -76,7 +89,7 @@ class TestStarAbsent:
             MockPlayer("Star1", 30.0, 10.0, 35.0, "Available"),
             MockPlayer("Star2", 25.0, 8.0, 34.0, "OUT"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         assert star_absent(tiers) == True
 
@@ -90,7 +103,7 @@ class TestGetAbsentStars:
             MockPlayer("Star1", 30.0, 10.0, 35.0, "Available"),
             MockPlayer("Star2", 25.0, 8.0, 34.0, "Available"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         absent = get_absent_stars(tiers)
         assert len(absent) == 0
@@ -101,7 +114,7 @@ class TestGetAbsentStars:
             MockPlayer("Star1", 30.0, 10.0, 35.0, "OUT"),
             MockPlayer("Star2", 25.0, 8.0, 34.0, "Available"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         absent = get_absent_stars(tiers)
         assert len(absent) == 1
@@ -115,7 +128,7 @@ class TestGetAbsentStars:
             MockPlayer("Star2", 25.0, 8.0, 34.0, "Doubtful"),
             MockPlayer("Star3", 20.0, 5.0, 32.0, "Available"),
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         absent = get_absent_stars(tiers)
         assert len(absent) == 2
@@ -133,7 +146,7 @@ class TestGetReplacementCandidates:
             MockPlayer("Bench1", 12.0, 2.0, 25.0),  # Candidate
             MockPlayer("Bench2", 10.0, 1.0, 20.0),  # Candidate
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         candidates = get_replacement_candidates(players, tiers)
         
@@ -153,7 +166,7 @@ class TestGetReplacementCandidates:
             MockPlayer("Bench1", 12.0, 2.0, 25.0, "OUT"),  # Excluded
             MockPlayer("Bench2", 10.0, 1.0, 20.0, "Available"),  # Included
         ]
-        tiers = select_star_tiers(players)
+        tiers = tiers_for(players)
         
         candidates = get_replacement_candidates(players, tiers)
         
@@ -178,8 +191,8 @@ class TestComputeRotationReplacement:
             MockPlayer("A3", 12.0, 2.0, 25.0),
         ]
         
-        home_tiers = select_star_tiers(home)
-        away_tiers = select_star_tiers(away)
+        home_tiers = tiers_for(home)
+        away_tiers = tiers_for(away)
         
         edge, detail = compute_rotation_replacement(
             home, away, home_tiers, away_tiers
@@ -203,8 +216,8 @@ class TestComputeRotationReplacement:
             MockPlayer("ABench1", 12.0, 2.0, 25.0),
         ]
         
-        home_tiers = select_star_tiers(home)
-        away_tiers = select_star_tiers(away)
+        home_tiers = tiers_for(home)
+        away_tiers = tiers_for(away)
         
         edge, detail = compute_rotation_replacement(
             home, away, home_tiers, away_tiers
@@ -227,8 +240,8 @@ class TestComputeRotationReplacement:
             MockPlayer("A2", 25.0, 8.0, 34.0),
         ]
         
-        home_tiers = select_star_tiers(home)
-        away_tiers = select_star_tiers(away)
+        home_tiers = tiers_for(home)
+        away_tiers = tiers_for(away)
         
         edge, detail = compute_rotation_replacement(
             home, away, home_tiers, away_tiers
@@ -250,8 +263,8 @@ class TestComputeRotationReplacement:
             MockPlayer("A2", 25.0, 8.0, 34.0),
         ]
         
-        home_tiers = select_star_tiers(home)
-        away_tiers = select_star_tiers(away)
+        home_tiers = tiers_for(home)
+        away_tiers = tiers_for(away)
         
         edge, detail = compute_rotation_replacement(
             home, away, home_tiers, away_tiers
@@ -272,8 +285,8 @@ class TestComputeRotationReplacement:
             MockPlayer("ABench1", 8.0, 1.0, 20.0),  # Weak replacement
         ]
         
-        home_tiers = select_star_tiers(home)
-        away_tiers = select_star_tiers(away)
+        home_tiers = tiers_for(home)
+        away_tiers = tiers_for(away)
         
         edge, detail = compute_rotation_replacement(
             home, away, home_tiers, away_tiers
@@ -301,11 +314,10 @@ class TestIntegration:
             MockPlayer("A2", 25.0, 8.0, 34.0),
         ]
         
-        home_tiers = select_star_tiers(home)
-        away_tiers = select_star_tiers(away)
+        home_tiers = tiers_for(home)
+        away_tiers = tiers_for(away)
         
         # Star factor
-        from model.star_impact import compute_star_factor
         signed, edge, detail = compute_star_factor(home, away)
         
         # Rotation replacement
@@ -329,11 +341,10 @@ class TestIntegration:
             MockPlayer("A2", 25.0, 8.0, 34.0),
         ]
         
-        home_tiers = select_star_tiers(home)
-        away_tiers = select_star_tiers(away)
+        home_tiers = tiers_for(home)
+        away_tiers = tiers_for(away)
         
         # Star factor
-        from model.star_impact import compute_star_factor
         signed, edge, detail = compute_star_factor(home, away)
         
         # Rotation replacement
@@ -2,14 +2,13 @@
 Tests for the score fetching and grading services.
 """
 
+import itertools
+import json
+
 import pytest
+import requests
 from datetime import datetime
-from unittest.mock import patch, MagicMock
-from pathlib import Path
-
-# Import services
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from unittest.mock import patch
 
 from services.scores import (
     GameScoreUpdate,
@@ -23,97 +22,80 @@ from services.grading import (
 )
 
 
+# Live scoreboard payload with one final game; variations shallow-copy it
+_BASE_SCOREBOARD = {
+    "scoreboard": {
+        "gameDate": "2026-02-04",
+        "games": [
+            {
+                "gameId": "0022500712",
+                "gameStatus": 3,  # Final
+                "awayTeam": {
+                    "teamTricode": "BOS",
+                    "score": "105"
+                },
+                "homeTeam": {
+                    "teamTricode": "NYK",
+                    "score": "112"
+                }
+            }
+        ]
+    }
+}
+
+
+# Each session gets a fresh database (see conftest's _worker_db), so a
+# counter is enough to keep test game IDs unique
+_game_id_seq = itertools.count(1)
+
+
+@pytest.fixture
+def scheduled_game():
+    """ID of a freshly upserted scheduled MIA @ ATL game."""
+    from storage.db import upsert_game
+    
+    return upsert_game(f"grading-test-{next(_game_id_seq)}", "2026-01-25", "MIA", "ATL", status="scheduled")
+
+
+def _json_response(request: requests.PreparedRequest, payload: dict) -> requests.Response:
+    """A 200 response carrying payload as its JSON body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(payload).encode()
+    response.request = request
+    response.url = request.url
+    return response
+
+
 class TestGameScoreUpdate:
     """Tests for GameScoreUpdate dataclass."""
     
-    def test_is_final_true(self):
-        """is_final should return True for final games."""
+    @pytest.mark.parametrize(
+        "status, away_score, home_score, is_final, is_in_progress, winner",
+        [
+            pytest.param("final", 105, 112, True, False, "HOME", id="final_home_wins"),
+            pytest.param("final", 115, 108, True, False, "AWAY", id="final_away_wins"),
+            pytest.param("scheduled", None, None, False, False, None, id="scheduled"),
+            pytest.param("in_progress", 52, 48, False, True, None, id="in_progress_no_winner"),
+            pytest.param("final", None, None, True, False, None, id="final_without_scores"),
+        ],
+    )
+    def test_status_properties(self, status, away_score, home_score,
+                               is_final, is_in_progress, winner):
+        """GameScoreUpdate should derive is_final, is_in_progress and winner from status and scores."""
         update = GameScoreUpdate(
             game_id="123",
             away_team="BOS",
             home_team="NYK",
             game_date="2026-02-04",
-            status="final",
-            away_score=105,
-            home_score=112
-        )
-        assert update.is_final is True
-    
-    def test_is_final_false_for_scheduled(self):
-        """is_final should return False for scheduled games."""
-        update = GameScoreUpdate(
-            game_id="123",
-            away_team="BOS",
-            home_team="NYK",
-            game_date="2026-02-04",
-            status="scheduled"
-        )
-        assert update.is_final is False
-    
-    def test_is_in_progress(self):
-        """is_in_progress should return True for live games."""
-        update = GameScoreUpdate(
-            game_id="123",
-            away_team="BOS",
-            home_team="NYK",
-            game_date="2026-02-04",
-            status="in_progress",
-            away_score=52,
-            home_score=48
-        )
-        assert update.is_in_progress is True
-    
-    def test_get_winner_side_home_wins(self):
-        """get_winner_side should return HOME when home team wins."""
-        update = GameScoreUpdate(
-            game_id="123",
-            away_team="BOS",
-            home_team="NYK",
-            game_date="2026-02-04",
-            status="final",
-            away_score=105,
-            home_score=112
+            status=status,
+            away_score=away_score,
+            home_score=home_score,
         )
-        assert update.get_winner_side() == "HOME"
-    
-    def test_get_winner_side_away_wins(self):
-        """get_winner_side should return AWAY when away team wins."""
-        update = GameScoreUpdate(
-            game_id="123",
-            away_team="BOS",
-            home_team="NYK",
-            game_date="2026-02-04",
-            status="final",
-            away_score=115,
-            home_score=108
-        )
-        assert update.get_winner_side() == "AWAY"
-    
-    def test_get_winner_side_none_if_not_final(self):
-        """get_winner_side should return None if game not final."""
-        update = GameScoreUpdate(
-            game_id="123",
-            away_team="BOS",
-            home_team="NYK",
-            game_date="2026-02-04",
-            status="in_progress",
-            away_score=52,
-            home_score=48
-        )
-        assert update.get_winner_side() is None
-    
-    def test_get_winner_side_none_if_no_scores(self):
-        """get_winner_side should return None if scores missing."""
-        update = GameScoreUpdate(
-            game_id="123",
-            away_team="BOS",
-            home_team="NYK",
-            game_date="2026-02-04",
-            status="final",
-            away_score=None,
-            home_score=None
-        )
-        assert update.get_winner_side() is None
+        assert update.is_final is is_final
+        assert update.is_in_progress is is_in_progress
+        assert update.get_winner_side() == winner
 
 
 class TestNBALiveScoreProvider:
@@ -129,41 +111,20 @@ class TestNBALiveScoreProvider:
         provider = NBALiveScoreProvider(timeout=30)
         assert provider.timeout == 30
     
-    @patch('services.scores.requests.get')
-    def test_get_games_handles_error(self, mock_get):
+    def test_get_games_handles_error(self):
         """Provider should handle request errors gracefully."""
-        import requests
-        mock_get.side_effect = requests.RequestException("Network error")
-        
+        # The session-wide network block makes every request fail
         provider = NBALiveScoreProvider()
         games = provider.get_games_for_date("2026-02-04")
         
         assert games == []
     
-    @patch('services.scores.requests.get')
-    def test_get_games_parses_response(self, mock_get):
+    def test_get_games_parses_response(self, monkeypatch):
         """Provider should parse API response correctly."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "scoreboard": {
-                "gameDate": "2026-02-04",
-                "games": [
-                    {
-                        "gameId": "0022500712",
-                        "gameStatus": 3,  # Final
-                        "awayTeam": {
-                            "teamTricode": "BOS",
-                            "score": "105"
-                        },
-                        "homeTeam": {
-                            "teamTricode": "NYK",
-                            "score": "112"
-                        }
-                    }
-                ]
-            }
-        }
-        mock_get.return_value = mock_response
+        monkeypatch.setattr(
+            requests.adapters.HTTPAdapter, "send",
+            lambda adapter, request, **kwargs: _json_response(request, _BASE_SCOREBOARD),
+        )
         
         provider = NBALiveScoreProvider()
         games = provider.get_games_for_date("2026-02-04")
@@ -175,6 +136,21 @@ class TestNBALiveScoreProvider:
         assert games[0].status == "final"
         assert games[0].away_score == 105
         assert games[0].home_score == 112
+    
+    def test_get_games_ignores_other_dates(self, monkeypatch):
+        """Provider should return nothing when the scoreboard is for another day."""
+        payload = {
+            **_BASE_SCOREBOARD,
+            "scoreboard": {**_BASE_SCOREBOARD["scoreboard"], "gameDate": "2026-02-03"},
+        }
+        monkeypatch.setattr(
+            requests.adapters.HTTPAdapter, "send",
+            lambda adapter, request, **kwargs: _json_response(request, payload),
+        )
+        
+        provider = NBALiveScoreProvider()
+        
+        assert provider.get_games_for_date("2026-02-04") == []
 
 
 class TestFetchScores:
@@ -232,13 +208,9 @@ class TestGrading:
         updated = update_games_from_scores([])
         assert updated == 0
     
-    def test_update_games_from_scores(self):
+    def test_update_games_from_scores(self, scheduled_game):
         """Should update games from score list."""
-        from storage.db import upsert_game, get_games_for_date
-        
-        # Create a game first
-        game_id = f"grading-test-{datetime.now().timestamp()}"
-        upsert_game(game_id, "2026-01-25", "MIA", "ATL", status="scheduled")
+        game_id = scheduled_game
         
         # Create score update
         score = GameScoreUpdate(
@@ -1,12 +1,12 @@
 """Unit tests for star_impact module."""
 
 import pytest
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional
 
 
-# Mock player class for testing
-@dataclass
+# Mock player class for testing (frozen so instances can be shared between tests)
+@dataclass(slots=True, frozen=True)
 class MockPlayer:
     player_name: str
     points_per_game: float
@@ -30,40 +30,43 @@ from model.star_impact import (
 )
 
 
+# Shared rosters (MockPlayer is frozen, so instances are safe to reuse)
+STAR1 = MockPlayer("Star1", points_per_game=30.0, assists_per_game=10.0, minutes_per_game=35.0)
+STAR2 = MockPlayer("Star2", points_per_game=25.0, assists_per_game=8.0, minutes_per_game=34.0)
+STAR3 = MockPlayer("Star3", points_per_game=20.0, assists_per_game=5.0, minutes_per_game=32.0)
+ROLE = MockPlayer("Role", points_per_game=10.0, assists_per_game=2.0, minutes_per_game=25.0)
+
+H1 = MockPlayer("H1", 30.0, 10.0, 35.0)
+H2 = MockPlayer("H2", 25.0, 8.0, 34.0)
+H3 = MockPlayer("H3", 20.0, 5.0, 32.0)
+A1 = MockPlayer("A1", 30.0, 10.0, 35.0)
+A2 = MockPlayer("A2", 25.0, 8.0, 34.0)
+
+
 class TestStatusMultiplier:
     """Tests for status_multiplier function."""
     
-    def test_out_status(self):
-        """OUT status should return 0.0"""
-        assert status_multiplier("OUT") == 0.0
-        assert status_multiplier("out") == 0.0
-        assert status_multiplier("O") == 0.0
-        assert status_multiplier("inactive") == 0.0
-    
-    def test_doubtful_status(self):
-        """DOUBTFUL status should return 0.25"""
-        assert status_multiplier("DOUBTFUL") == 0.25
-        assert status_multiplier("doubtful") == 0.25
-        assert status_multiplier("D") == 0.25
+    @pytest.mark.parametrize("status, expected", [
+        # OUT
+        ("OUT", 0.0), ("out", 0.0), ("O", 0.0), ("inactive", 0.0),
+        # DOUBTFUL
+        ("DOUBTFUL", 0.25), ("doubtful", 0.25), ("D", 0.25),
+        # QUESTIONABLE
+        ("QUESTIONABLE", 0.60), ("Q", 0.60), ("GTD", 0.60),
+        # PROBABLE
+        ("PROBABLE", 0.85), ("P", 0.85),
+        # AVAILABLE
+        ("Available", 1.0), ("ACTIVE", 1.0), ("healthy", 1.0), (None, 1.0), ("", 1.0),
+    ])
+    def test_status_multiplier(self, status, expected):
+        """Each injury status alias should map to its multiplier."""
+        assert status_multiplier(status) == expected
     
-    def test_questionable_status(self):
-        """QUESTIONABLE status should return 0.60"""
-        assert status_multiplier("QUESTIONABLE") == 0.60
-        assert status_multiplier("Q") == 0.60
-        assert status_multiplier("GTD") == 0.60
-    
-    def test_probable_status(self):
-        """PROBABLE status should return 0.85"""
-        assert status_multiplier("PROBABLE") == 0.85
-        assert status_multiplier("P") == 0.85
-    
-    def test_available_status(self):
-        """AVAILABLE status should return 1.0"""
-        assert status_multiplier("Available") == 1.0
-        assert status_multiplier("ACTIVE") == 1.0
-        assert status_multiplier("healthy") == 1.0
-        assert status_multiplier(None) == 1.0
-        assert status_multiplier("") == 1.0
+    def test_unknown_status_warns_every_time(self):
+        """Each lookup of an unknown status should warn, not just the first."""
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Unknown player status"):
+                assert status_multiplier("suspended") == 1.0
 
 
 class TestImpactMetric:
@@ -91,19 +94,13 @@ class TestSelectStarTiers:
     
     def test_single_player(self):
         """Single player should be in Tier A only"""
-        player = MockPlayer("Star", points_per_game=30.0, assists_per_game=10.0, minutes_per_game=35.0)
-        result = select_star_tiers([player])
+        result = select_star_tiers([STAR1])
         assert len(result["tier_a"]) == 1
         assert len(result["tier_b"]) == 0
     
     def test_multiple_players(self):
         """Top player in A, next 2 in B"""
-        star1 = MockPlayer("Star1", points_per_game=30.0, assists_per_game=10.0, minutes_per_game=35.0)
-        star2 = MockPlayer("Star2", points_per_game=25.0, assists_per_game=8.0, minutes_per_game=34.0)
-        star3 = MockPlayer("Star3", points_per_game=20.0, assists_per_game=5.0, minutes_per_game=32.0)
-        role = MockPlayer("Role", points_per_game=10.0, assists_per_game=2.0, minutes_per_game=25.0)
-        
-        result = select_star_tiers([star1, star2, star3, role])
+        result = select_star_tiers([STAR1, STAR2, STAR3, ROLE])
         
         assert len(result["tier_a"]) == 1
         assert result["tier_a"][0].player_name == "Star1"
@@ -112,12 +109,21 @@ class TestSelectStarTiers:
         assert result["tier_b"][0].player_name == "Star2"
         assert result["tier_b"][1].player_name == "Star3"
     
+    def test_ties_keep_roster_order(self):
+        """Equal-impact players should be tiered in roster order"""
+        twin1 = replace(STAR2, player_name="Twin1")
+        twin2 = replace(STAR2, player_name="Twin2")
+        
+        result = select_star_tiers([ROLE, twin1, STAR1, twin2, STAR3])
+        
+        assert [p.player_name for p in result["tier_a"]] == ["Star1"]
+        assert [p.player_name for p in result["tier_b"]] == ["Twin1", "Twin2"]
+    
     def test_mpg_filter(self):
         """Players with MPG < 20 should be filtered unless no candidates remain"""
-        star1 = MockPlayer("Star1", points_per_game=30.0, assists_per_game=10.0, minutes_per_game=35.0)
         bench = MockPlayer("Bench", points_per_game=15.0, assists_per_game=3.0, minutes_per_game=15.0)
         
-        result = select_star_tiers([star1, bench])
+        result = select_star_tiers([STAR1, bench])
         
         # Bench player filtered due to low MPG
         assert len(result["tier_a"]) == 1
@@ -129,33 +135,21 @@ class TestTeamStarPoints:
     
     def test_full_strength(self):
         """All stars available should get max points"""
-        star1 = MockPlayer("Star1", points_per_game=30.0, assists_per_game=10.0, minutes_per_game=35.0, status="Available")
-        star2 = MockPlayer("Star2", points_per_game=25.0, assists_per_game=8.0, minutes_per_game=34.0, status="Available")
-        star3 = MockPlayer("Star3", points_per_game=20.0, assists_per_game=5.0, minutes_per_game=32.0, status="Available")
-        
-        points, details = team_star_points([star1, star2, star3])
+        points, details = team_star_points([STAR1, STAR2, STAR3])
         
         # Tier A (4.0) + 2 x Tier B (2.0) = 8.0
         assert points == 8.0
     
     def test_star_out(self):
         """Star OUT should reduce points"""
-        star1 = MockPlayer("Star1", points_per_game=30.0, assists_per_game=10.0, minutes_per_game=35.0, status="OUT")
-        star2 = MockPlayer("Star2", points_per_game=25.0, assists_per_game=8.0, minutes_per_game=34.0, status="Available")
-        star3 = MockPlayer("Star3", points_per_game=20.0, assists_per_game=5.0, minutes_per_game=32.0, status="Available")
-        
-        points, details = team_star_points([star1, star2, star3])
+        points, details = team_star_points([replace(STAR1, status="OUT"), STAR2, STAR3])
         
         # Tier A out (0) + 2 x Tier B (2.0) = 4.0
         assert points == 4.0
     
     def test_star_questionable(self):
         """Star QUESTIONABLE should get partial points"""
-        star1 = MockPlayer("Star1", points_per_game=30.0, assists_per_game=10.0, minutes_per_game=35.0, status="Questionable")
-        star2 = MockPlayer("Star2", points_per_game=25.0, assists_per_game=8.0, minutes_per_game=34.0, status="Available")
-        star3 = MockPlayer("Star3", points_per_game=20.0, assists_per_game=5.0, minutes_per_game=32.0, status="Available")
-        
-        points, details = team_star_points([star1, star2, star3])
+        points, details = team_star_points([replace(STAR1, status="Questionable"), STAR2, STAR3])
         
         # Tier A (4.0 * 0.6 = 2.4) + 2 x Tier B (2.0) = 6.4
         assert abs(points - 6.4) < 0.01
@@ -166,8 +160,8 @@ class TestStarEdgePoints:
     
     def test_equal_teams(self):
         """Equal teams should have zero edge"""
-        home = [MockPlayer("H1", 30.0, 10.0, 35.0), MockPlayer("H2", 25.0, 8.0, 34.0)]
-        away = [MockPlayer("A1", 30.0, 10.0, 35.0), MockPlayer("A2", 25.0, 8.0, 34.0)]
+        home = [H1, H2]
+        away = [A1, A2]
         
         edge, detail = star_edge_points(home, away)
         
@@ -176,8 +170,8 @@ class TestStarEdgePoints:
     
     def test_home_advantage(self):
         """Home team with star out vs healthy away should be negative"""
-        home = [MockPlayer("H1", 30.0, 10.0, 35.0, "OUT"), MockPlayer("H2", 25.0, 8.0, 34.0)]
-        away = [MockPlayer("A1", 30.0, 10.0, 35.0), MockPlayer("A2", 25.0, 8.0, 34.0)]
+        home = [replace(H1, status="OUT"), H2]
+        away = [A1, A2]
         
         edge, detail = star_edge_points(home, away)
         
@@ -188,8 +182,8 @@ class TestStarEdgePoints:
     
     def test_away_disadvantage(self):
         """Away team with star out should give positive edge"""
-        home = [MockPlayer("H1", 30.0, 10.0, 35.0), MockPlayer("H2", 25.0, 8.0, 34.0)]
-        away = [MockPlayer("A1", 30.0, 10.0, 35.0, "OUT"), MockPlayer("A2", 25.0, 8.0, 34.0)]
+        home = [H1, H2]
+        away = [replace(A1, status="OUT"), A2]
         
         edge, detail = star_edge_points(home, away)
         
@@ -201,7 +195,7 @@ class TestStarEdgePoints:
     def test_edge_clamp(self):
         """Edge should be clamped to [-6, +6]"""
         # This tests the clamp works even if theoretical edge is extreme
-        home = [MockPlayer("H1", 30.0, 10.0, 35.0), MockPlayer("H2", 25.0, 8.0, 34.0), MockPlayer("H3", 20.0, 5.0, 32.0)]
+        home = [H1, H2, H3]
         away = []  # No players = 0 points
         
         edge, detail = star_edge_points(home, away)
@@ -239,8 +233,8 @@ class TestIntegration:
     
     def test_no_star_out_returns_small_contribution(self):
         """When all stars are available, edge should be 0"""
-        home = [MockPlayer("H1", 30.0, 10.0, 35.0), MockPlayer("H2", 25.0, 8.0, 34.0)]
-        away = [MockPlayer("A1", 30.0, 10.0, 35.0), MockPlayer("A2", 25.0, 8.0, 34.0)]
+        home = [H1, H2]
+        away = [A1, A2]
         
         signed, edge, detail = compute_star_factor(home, away)
         
@@ -248,8 +242,8 @@ class TestIntegration:
     
     def test_star_out_produces_negative_signed(self):
         """Home star out should produce negative signed value"""
-        home = [MockPlayer("H1", 30.0, 10.0, 35.0, "OUT"), MockPlayer("H2", 25.0, 8.0, 34.0)]
-        away = [MockPlayer("A1", 30.0, 10.0, 35.0), MockPlayer("A2", 25.0, 8.0, 34.0)]
+        home = [replace(H1, status="OUT"), H2]
+        away = [A1, A2]
         
         signed, edge, detail = compute_star_factor(home, away)
         
@@ -259,12 +253,12 @@ class TestIntegration:
         """Role player out should not be in tiers, minimal impact"""
         # Tier A and B are all available
         home = [
-            MockPlayer("H1", 30.0, 10.0, 35.0),  # Tier A
-            MockPlayer("H2", 25.0, 8.0, 34.0),   # Tier B
-            MockPlayer("H3", 20.0, 5.0, 32.0),   # Tier B
-            MockPlayer("Role", 10.0, 2.0, 25.0, "OUT"),  # Role player OUT
+            H1,  # Tier A
+            H2,  # Tier B
+            H3,  # Tier B
+            replace(ROLE, status="OUT"),  # Role player OUT
         ]
-        away = [MockPlayer("A1", 30.0, 10.0, 35.0), MockPlayer("A2", 25.0, 8.0, 34.0)]
+        away = [A1, A2]
         
         signed, edge, detail = compute_star_factor(home, away)
         
@@ -2,57 +2,117 @@
 Tests for the SQLite storage module with daily slate and per-game locking.
 """
 
-import os
+import csv
+import dataclasses
 import pytest
-import tempfile
+import sqlite3
+import threading
 from pathlib import Path
-from datetime import datetime, timedelta
-from unittest.mock import patch
-
-# Import storage module
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from uuid import uuid4
 
 from storage.db import (
     get_db_path,
     connect,
-    init_db,
+    batch,
     upsert_game,
     get_game,
+    update_game_scores,
+    upsert_games_bulk,
+    upsert_game_returning,
+    upsert_daily_picks_bulk,
+    upsert_picks_bulk,
     upsert_daily_slate,
     get_daily_slate,
     upsert_daily_pick_if_unlocked,
     get_daily_picks,
     get_daily_pick,
+    get_daily_picks_by_ids,
     grade_daily_pick,
+    grade_daily_picks_bulk,
+    grade_picks_bulk,
+    get_ungraded_daily_picks,
+    iter_ungraded_daily_picks,
     is_game_locked,
     lock_game_if_started,
     lock_all_started_games,
     compute_stats,
+    export_to_csv,
     generate_game_id,
     get_now_local,
     get_today_date_local,
+    utc_to_local,
     WinrateStats,
+    _get_connection,
+    _reset_for_tests,
 )
 
 
+@pytest.fixture(autouse=True)
+def db_conn(request):
+    """
+    This thread's storage connection, with the test's writes rolled back.
+    
+    Each test runs inside a savepoint on the connection the storage
+    functions use, so rows it writes are visible to the test itself but
+    never reach later tests.
+    
+    Tests marked real_transactions run without the savepoint, so writes
+    take the top-level BEGIN IMMEDIATE/COMMIT path. They must delete what
+    they commit (see committed_game_ids).
+    """
+    conn = _get_connection()
+    if request.node.get_closest_marker("real_transactions"):
+        yield conn
+        return
+    conn.execute("SAVEPOINT test_case")
+    yield conn
+    conn.execute("ROLLBACK TO test_case")
+    conn.execute("RELEASE test_case")
+
+
+@pytest.fixture
+def committed_game_ids(db_conn):
+    """Game IDs a real_transactions test committed; deleted after the test."""
+    game_ids = []
+    yield game_ids
+    db_conn.executemany(
+        "DELETE FROM games WHERE game_id = ?", [(game_id,) for game_id in game_ids]
+    )
+
+
+def _unique_id(prefix: str) -> str:
+    """An ID that won't collide with rows from other tests or runs."""
+    return f"{prefix}-{uuid4().hex[:8]}"
+
+
 class TestDatabasePath:
     """Tests for database path handling."""
     
-    def test_get_db_path_returns_path(self):
-        """Database path should be a Path object."""
-        db_path = get_db_path()
-        assert isinstance(db_path, Path)
-    
-    def test_get_db_path_has_db_extension(self):
-        """Database path should have .db extension."""
-        db_path = get_db_path()
-        assert db_path.suffix == '.db'
+    @pytest.mark.parametrize("check", [
+        pytest.param(lambda p: isinstance(p, Path), id="is_path"),
+        pytest.param(lambda p: p.suffix == '.db', id="has_db_extension"),
+        pytest.param(lambda p: p.is_absolute(), id="is_absolute"),
+    ])
+    def test_get_db_path(self, check):
+        """Database path should be an absolute .db Path (get_db_path() is cached)."""
+        assert check(get_db_path())
     
-    def test_get_db_path_is_absolute(self):
-        """Database path should be absolute."""
-        db_path = get_db_path()
-        assert db_path.is_absolute()
+    @pytest.mark.real_transactions
+    def test_reset_for_tests_switches_database(self, tmp_path, monkeypatch):
+        """_reset_for_tests() should drop the cached path, schema and connections."""
+        old_conn = _get_connection()
+        monkeypatch.setenv('NBA_DB_PATH', str(tmp_path / 'other.db'))
+        _reset_for_tests()
+        try:
+            assert get_db_path() == tmp_path / 'other.db'
+            assert _get_connection() is not old_conn
+            upsert_game(_unique_id("reset-test"), "2026-02-06", "BOS", "NYK")
+        finally:
+            monkeypatch.undo()
+            _reset_for_tests()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            old_conn.execute("SELECT 1")
 
 
 class TestConnection:
@@ -69,6 +129,22 @@ class TestConnection:
         conn = connect()
         assert conn.row_factory is not None
         conn.close()
+    
+    @pytest.mark.real_transactions
+    def test_writes_from_worker_thread_visible(self, committed_game_ids):
+        """Writes made on another thread's connection should be visible here."""
+        game_id = _unique_id("thread-test")
+        committed_game_ids.append(game_id)
+        worker = threading.Thread(target=upsert_game, kwargs=dict(
+            game_id=game_id,
+            game_date="2026-02-06",
+            away_team="BOS",
+            home_team="NYK",
+        ))
+        worker.start()
+        worker.join()
+        
+        assert get_game(game_id) is not None
 
 
 class TestGameIdGeneration:
@@ -123,7 +199,7 @@ class TestGameOperations:
     
     def test_upsert_game_new(self):
         """Upserting a new game should succeed."""
-        game_id = f"test-game-{datetime.now().timestamp()}"
+        game_id = _unique_id("test-game")
         
         result = upsert_game(
             game_id=game_id,
@@ -137,7 +213,7 @@ class TestGameOperations:
     
     def test_upsert_game_with_start_time(self):
         """Game should store start time in local format."""
-        game_id = f"test-start-time-{datetime.now().timestamp()}"
+        game_id = _unique_id("test-start-time")
         
         upsert_game(
             game_id=game_id,
@@ -154,7 +230,7 @@ class TestGameOperations:
     
     def test_upsert_game_updates_existing(self):
         """Upserting an existing game should update it."""
-        game_id = f"test-game-update-{datetime.now().timestamp()}"
+        game_id = _unique_id("test-game-update")
         
         # Insert
         upsert_game(
@@ -180,6 +256,59 @@ class TestGameOperations:
         assert game['status'] == "final"
         assert game['away_score'] == 105
         assert game['home_score'] == 112
+    
+    def test_upsert_game_returning(self):
+        """upsert_game_returning should return the row as stored."""
+        game_id = _unique_id("test-returning")
+        game = {
+            'game_id': game_id,
+            'game_date': "2026-02-04",
+            'away_team': "BOS",
+            'home_team': "NYK",
+            'start_time_local': "2026-02-04T19:30:00",
+        }
+        
+        row = upsert_game_returning(game)
+        assert row['game_id'] == game_id
+        assert row['status'] == "scheduled"
+        assert row['start_time_local'] == "2026-02-04T19:30:00"
+        
+        # Update keeps the stored start time when none is given
+        row = upsert_game_returning({**game, 'start_time_local': None, 'status': "final",
+                                     'away_score': 99, 'home_score': 101})
+        assert row['status'] == "final"
+        assert row['home_score'] == 101
+        assert row['start_time_local'] == "2026-02-04T19:30:00"
+    
+    def test_update_game_scores_batch(self):
+        """Batch score updates should update every listed game."""
+        stamp = uuid4().hex[:8]
+        game_ids = [f"test-batch-score-{i}-{stamp}" for i in range(3)]
+        for game_id in game_ids:
+            upsert_game(
+                game_id=game_id,
+                game_date="2026-02-05",
+                away_team="BOS",
+                home_team="NYK",
+                status="scheduled"
+            )
+        
+        updated = update_game_scores(
+            [(game_id, "final", 100 + i, 90 + i) for i, game_id in enumerate(game_ids)],
+            now="2026-02-05T23:00:00",
+        )
+        assert updated == 3
+        
+        for i, game_id in enumerate(game_ids):
+            game = get_game(game_id)
+            assert game['status'] == "final"
+            assert game['away_score'] == 100 + i
+            assert game['home_score'] == 90 + i
+            assert game['last_checked_at'] == "2026-02-05T23:00:00"
+    
+    def test_update_game_scores_empty(self):
+        """An empty batch should be a no-op."""
+        assert update_game_scores([]) == 0
 
 
 class TestLocking:
@@ -187,7 +316,7 @@ class TestLocking:
     
     def test_game_not_locked_before_start(self):
         """Game should not be locked before start time."""
-        game_id = f"lock-test-1-{datetime.now().timestamp()}"
+        game_id = _unique_id("lock-test-1")
         slate_date = "2026-03-01"
         
         # Set game start time in the future
@@ -207,7 +336,7 @@ class TestLocking:
     
     def test_game_locked_after_start(self):
         """Game should be locked after start time passes."""
-        game_id = f"lock-test-2-{datetime.now().timestamp()}"
+        game_id = _unique_id("lock-test-2")
         slate_date = "2026-03-02"
         
         # Set game start time in the past
@@ -240,7 +369,7 @@ class TestLocking:
     
     def test_game_locked_when_in_progress(self):
         """Game should be locked when status is in_progress."""
-        game_id = f"lock-test-3-{datetime.now().timestamp()}"
+        game_id = _unique_id("lock-test-3")
         slate_date = "2026-03-03"
         
         upsert_game(
@@ -253,9 +382,14 @@ class TestLocking:
         
         assert is_game_locked(slate_date, game_id) is True
     
+    def test_unknown_game_not_locked(self):
+        """A game with no game or pick record should not be locked."""
+        game_id = _unique_id("lock-test-missing")
+        assert is_game_locked("2026-03-03", game_id, "2026-03-03T23:00:00") is False
+    
     def test_lock_game_if_started(self):
         """lock_game_if_started should set locked=1."""
-        game_id = f"lock-test-4-{datetime.now().timestamp()}"
+        game_id = _unique_id("lock-test-4")
         slate_date = "2026-03-04"
         start_time = "2026-03-04T19:00:00"
         
@@ -286,6 +420,75 @@ class TestLocking:
         pick = get_daily_pick(slate_date, game_id)
         assert pick is not None
         assert pick['locked'] == 1
+    
+    def test_lock_all_started_games(self):
+        """lock_all_started_games should lock only started games on the slate."""
+        slate_date = "2026-03-05"
+        pick_data = {
+            'matchup': 'BOS @ NYK',
+            'pick_team': 'NYK',
+            'pick_side': 'HOME',
+            'conf_pct': 60.0,
+            'bucket': 'MEDIUM',
+        }
+        
+        game_ids = []
+        for i, (start_time, status) in enumerate([
+            ("2026-03-05T19:00:00", "scheduled"),
+            ("2026-03-05T22:00:00", "scheduled"),
+            (None, "in_progress"),
+        ]):
+            game_id = _unique_id(f"lock-all-{i}")
+            upsert_game(
+                game_id=game_id,
+                game_date=slate_date,
+                away_team="BOS",
+                home_team="NYK",
+                start_time_local=start_time,
+                status="scheduled"
+            )
+            upsert_daily_pick_if_unlocked(slate_date, game_id, pick_data, "2026-03-05T12:00:00")
+            upsert_game(
+                game_id=game_id,
+                game_date=slate_date,
+                away_team="BOS",
+                home_team="NYK",
+                status=status
+            )
+            game_ids.append(game_id)
+        
+        locked = lock_all_started_games(slate_date, "2026-03-05T19:30:00")
+        assert locked == 2
+        
+        picks = get_daily_picks_by_ids(slate_date, game_ids)
+        assert [picks[g]['locked'] for g in game_ids] == [1, 0, 1]
+        
+        # Already-locked picks are not counted again
+        assert lock_all_started_games(slate_date, "2026-03-05T19:30:00") == 0
+    
+    def test_lock_all_skips_empty_start_time(self):
+        """A scheduled game with an empty start time should not be locked."""
+        slate_date = "2026-03-06"
+        game_id = _unique_id("lock-all-empty-start")
+        upsert_game(
+            game_id=game_id,
+            game_date=slate_date,
+            away_team="BOS",
+            home_team="NYK",
+            start_time_local="",
+            status="scheduled"
+        )
+        upsert_daily_pick_if_unlocked(slate_date, game_id, {
+            'matchup': 'BOS @ NYK',
+            'pick_team': 'NYK',
+            'pick_side': 'HOME',
+            'conf_pct': 60.0,
+            'bucket': 'MEDIUM',
+        }, "2026-03-06T12:00:00")
+        
+        assert lock_all_started_games(slate_date, "2026-03-06T19:30:00") == 0
+        assert get_daily_pick(slate_date, game_id)['locked'] == 0
+        assert is_game_locked(slate_date, game_id, "2026-03-06T19:30:00") is False
 
 
 class TestDailyPickOperations:
@@ -293,7 +496,7 @@ class TestDailyPickOperations:
     
     def test_upsert_pick_saves_when_unlocked(self):
         """Pick should be saved when game hasn't started."""
-        game_id = f"pick-test-1-{datetime.now().timestamp()}"
+        game_id = _unique_id("pick-test-1")
         slate_date = "2026-03-10"
         
         # Game starts in future
@@ -327,7 +530,7 @@ class TestDailyPickOperations:
     
     def test_upsert_pick_blocked_when_locked(self):
         """Pick should not be saved when game has started."""
-        game_id = f"pick-test-2-{datetime.now().timestamp()}"
+        game_id = _unique_id("pick-test-2")
         slate_date = "2026-03-11"
         
         # Game starts at 19:00, status is scheduled initially
@@ -375,7 +578,7 @@ class TestDailyPickOperations:
     
     def test_pick_overwritten_before_start(self):
         """Pick should be overwritten if game hasn't started."""
-        game_id = f"pick-test-3-{datetime.now().timestamp()}"
+        game_id = _unique_id("pick-test-3")
         slate_date = "2026-03-12"
         
         # Game starts at 20:00
@@ -416,6 +619,34 @@ class TestDailyPickOperations:
         pick = get_daily_pick(slate_date, game_id)
         assert pick['pick_team'] == 'ATL'
         assert pick['conf_pct'] == 65.0
+    
+    def test_get_daily_picks_returns_dicts(self):
+        """get_daily_picks should return plain dicts with game info joined."""
+        game_id = _unique_id("pick-test-4")
+        slate_date = "2026-03-13"
+        
+        upsert_game(
+            game_id=game_id,
+            game_date=slate_date,
+            away_team="DAL",
+            home_team="HOU",
+            start_time_local="2026-03-13T20:00:00",
+            status="scheduled"
+        )
+        pick_data = {
+            'matchup': 'DAL @ HOU',
+            'pick_team': 'HOU',
+            'pick_side': 'HOME',
+            'conf_pct': 58.0,
+            'bucket': 'LOW',
+        }
+        upsert_daily_pick_if_unlocked(slate_date, game_id, pick_data, "2026-03-13T12:00:00")
+        
+        picks = [p for p in get_daily_picks(slate_date) if p['game_id'] == game_id]
+        assert len(picks) == 1
+        assert isinstance(picks[0], dict)
+        assert picks[0].get('home_team') == 'HOU'
+        assert picks[0].get('start_time_local') == "2026-03-13T20:00:00"
 
 
 class TestPartialSlateUpdate:
@@ -425,27 +656,8 @@ class TestPartialSlateUpdate:
         """Only started games should be locked."""
         slate_date = "2026-03-15"
         
-        # Game 1: started at 18:00
-        game_id_1 = f"partial-1-{datetime.now().timestamp()}"
-        upsert_game(
-            game_id=game_id_1,
-            game_date=slate_date,
-            away_team="BOS",
-            home_team="NYK",
-            start_time_local="2026-03-15T18:00:00",
-            status="scheduled"
-        )
-        
-        # Game 2: starts at 20:00
-        game_id_2 = f"partial-2-{datetime.now().timestamp()}"
-        upsert_game(
-            game_id=game_id_2,
-            game_date=slate_date,
-            away_team="LAL",
-            home_team="GSW",
-            start_time_local="2026-03-15T20:00:00",
-            status="scheduled"
-        )
+        game_id_1 = _unique_id("partial-1")
+        game_id_2 = _unique_id("partial-2")
         
         # Save picks for both games at 17:30 (before both start)
         pick_1 = {
@@ -463,8 +675,18 @@ class TestPartialSlateUpdate:
             'bucket': 'MEDIUM',
         }
         
-        upsert_daily_pick_if_unlocked(slate_date, game_id_1, pick_1, "2026-03-15T17:30:00")
-        upsert_daily_pick_if_unlocked(slate_date, game_id_2, pick_2, "2026-03-15T17:30:00")
+        upsert_games_bulk([
+            # Game 1: started at 18:00
+            {'game_id': game_id_1, 'game_date': slate_date, 'away_team': "BOS",
+             'home_team': "NYK", 'start_time_local': "2026-03-15T18:00:00"},
+            # Game 2: starts at 20:00
+            {'game_id': game_id_2, 'game_date': slate_date, 'away_team': "LAL",
+             'home_team': "GSW", 'start_time_local': "2026-03-15T20:00:00"},
+        ])
+        
+        upsert_daily_picks_bulk(
+            slate_date, [(game_id_1, pick_1), (game_id_2, pick_2)], "2026-03-15T17:30:00"
+        )
         
         # Now at 18:30 - game 1 started, game 2 not started
         now_time = "2026-03-15T18:30:00"
@@ -485,8 +707,9 @@ class TestPartialSlateUpdate:
             'bucket': 'MEDIUM',
         }
         
-        saved_1, locked_1 = upsert_daily_pick_if_unlocked(slate_date, game_id_1, pick_1_new, now_time)
-        saved_2, locked_2 = upsert_daily_pick_if_unlocked(slate_date, game_id_2, pick_2_new, now_time)
+        (saved_1, locked_1), (saved_2, locked_2) = upsert_daily_picks_bulk(
+            slate_date, [(game_id_1, pick_1_new), (game_id_2, pick_2_new)], now_time
+        )
         
         # Game 1 should be locked (started)
         assert saved_1 is False
@@ -496,13 +719,130 @@ class TestPartialSlateUpdate:
         assert saved_2 is True
         assert locked_2 is False
         
+        picks = get_daily_picks_by_ids(slate_date, [game_id_1, game_id_2])
+        
         # Verify game 1 pick unchanged
-        p1 = get_daily_pick(slate_date, game_id_1)
-        assert p1['pick_team'] == 'NYK'
+        assert picks[game_id_1]['pick_team'] == 'NYK'
         
         # Verify game 2 pick changed
-        p2 = get_daily_pick(slate_date, game_id_2)
-        assert p2['pick_team'] == 'LAL'
+        assert picks[game_id_2]['pick_team'] == 'LAL'
+
+
+class TestBulkOperations:
+    """Tests for bulk game and pick upserts."""
+    
+    def test_upsert_games_bulk(self):
+        """Bulk game upsert should store every game."""
+        stamp = uuid4().hex[:8]
+        games = [
+            {
+                'game_id': f"bulk-game-{i}-{stamp}",
+                'game_date': "2026-03-16",
+                'away_team': "BOS",
+                'home_team': "NYK",
+                'start_time_local': f"2026-03-16T{18 + i}:00:00",
+            }
+            for i in range(3)
+        ]
+        
+        game_ids = upsert_games_bulk(games)
+        assert game_ids == [g['game_id'] for g in games]
+        
+        for game in games:
+            stored = get_game(game['game_id'])
+            assert stored['start_time_local'] == game['start_time_local']
+            assert stored['status'] == "scheduled"
+    
+    def test_upsert_daily_picks_bulk_respects_locks(self):
+        """Bulk pick upsert should skip started games and save the rest."""
+        slate_date = "2026-03-16"
+        stamp = uuid4().hex[:8]
+        started_id = f"bulk-pick-started-{stamp}"
+        open_id = f"bulk-pick-open-{stamp}"
+        upsert_games_bulk([
+            {'game_id': started_id, 'game_date': slate_date, 'away_team': "BOS",
+             'home_team': "NYK", 'start_time_local': "2026-03-16T18:00:00"},
+            {'game_id': open_id, 'game_date': slate_date, 'away_team': "LAL",
+             'home_team': "GSW", 'start_time_local': "2026-03-16T21:00:00"},
+        ])
+        
+        pick = {
+            'matchup': 'BOS @ NYK',
+            'pick_team': 'NYK',
+            'pick_side': 'HOME',
+            'conf_pct': 61.0,
+            'bucket': 'MEDIUM',
+        }
+        results = upsert_daily_picks_bulk(
+            slate_date, [(started_id, pick), (open_id, pick)], "2026-03-16T18:30:00"
+        )
+        
+        assert results == [(False, True), (True, False)]
+        picks = get_daily_picks_by_ids(slate_date, [started_id, open_id])
+        assert started_id not in picks
+        assert picks[open_id]['conf_pct'] == 61.0
+    
+    def test_upsert_picks_bulk_legacy(self, db_conn):
+        """Legacy bulk pick upsert should insert rows and update results."""
+        stamp = uuid4().hex[:8]
+        rows = [
+            (f"legacy-pick-{i}-{stamp}", "run-1", f"game-{i}", "BOS @ NYK", "NYK", "HOME",
+             60.0, "MEDIUM", None, None, None, None, None, None, None, "PENDING")
+            for i in range(2)
+        ]
+        
+        assert upsert_picks_bulk(rows) == [row[0] for row in rows]
+        upsert_picks_bulk([rows[0][:-1] + ("W",)])
+        
+        results = dict(db_conn.execute(
+            "SELECT pick_id, result FROM picks WHERE pick_id IN (?, ?)",
+            (rows[0][0], rows[1][0]),
+        ).fetchall())
+        
+        assert results == {rows[0][0]: "W", rows[1][0]: "PENDING"}
+    
+    @pytest.mark.real_transactions
+    def test_bulk_upsert_joins_open_transaction(self, db_conn, committed_game_ids):
+        """Bulk writes inside a caller's transaction should roll back with it."""
+        stamp = uuid4().hex[:8]
+        games = [
+            {'game_id': f"txn-game-{i}-{stamp}", 'game_date': "2026-03-16",
+             'away_team': "BOS", 'home_team': "NYK"}
+            for i in range(2)
+        ]
+        committed_game_ids.extend(g['game_id'] for g in games)
+        
+        with pytest.raises(RuntimeError):
+            with batch():
+                upsert_games_bulk(games)
+                assert db_conn.in_transaction
+                raise RuntimeError("abort")
+        
+        assert not db_conn.in_transaction
+        assert get_game(games[0]['game_id']) is None
+        assert get_game(games[1]['game_id']) is None
+    
+    @pytest.mark.real_transactions
+    def test_batch_commits_once_and_rolls_back_on_error(self, db_conn, committed_game_ids):
+        """batch() should commit its writes together, or none of them."""
+        stamp = uuid4().hex[:8]
+        kept, dropped = f"batch-kept-{stamp}", f"batch-dropped-{stamp}"
+        committed_game_ids.extend([kept, f"{kept}-nested", dropped])
+        
+        with batch():
+            upsert_game(kept, "2026-03-16", "BOS", "NYK")
+            with batch():
+                upsert_game(f"{kept}-nested", "2026-03-16", "LAL", "GSW")
+        assert not db_conn.in_transaction
+        
+        with pytest.raises(RuntimeError):
+            with batch():
+                upsert_game(dropped, "2026-03-16", "BOS", "NYK")
+                raise RuntimeError("abort")
+        
+        assert get_game(kept) is not None
+        assert get_game(f"{kept}-nested") is not None
+        assert get_game(dropped) is None
 
 
 class TestGrading:
@@ -510,7 +850,7 @@ class TestGrading:
     
     def test_grade_daily_pick(self):
         """Grading a pick should update result and lock it."""
-        game_id = f"grade-test-{datetime.now().timestamp()}"
+        game_id = _unique_id("grade-test")
         slate_date = "2026-03-20"
         
         upsert_game(
@@ -537,6 +877,70 @@ class TestGrading:
         assert pick['result'] == "W"
         assert pick['graded_at'] is not None
         assert pick['locked'] == 1
+    
+    def test_grade_daily_picks_bulk(self):
+        """Bulk grading should update and lock every listed pick."""
+        slate_date = "2026-03-20"
+        stamp = uuid4().hex[:8]
+        game_ids = [f"bulk-grade-test-{i}-{stamp}" for i in range(2)]
+        for game_id in game_ids:
+            upsert_game(game_id=game_id, game_date=slate_date,
+                        away_team="PHX", home_team="DEN", status="scheduled")
+            upsert_daily_pick_if_unlocked(slate_date, game_id, {
+                'matchup': 'PHX @ DEN',
+                'pick_team': 'DEN',
+                'pick_side': 'HOME',
+                'conf_pct': 58.0,
+                'bucket': 'LOW',
+            }, "2026-03-20T10:00:00")
+        
+        updated = grade_daily_picks_bulk([
+            (slate_date, game_ids[0], "W"),
+            (slate_date, game_ids[1], "L"),
+        ])
+        
+        assert updated == 2
+        picks = get_daily_picks_by_ids(slate_date, game_ids)
+        assert picks[game_ids[0]]['result'] == "W"
+        assert picks[game_ids[1]]['result'] == "L"
+        assert picks[game_ids[1]]['locked'] == 1
+    
+    def test_grade_picks_bulk_legacy(self):
+        """Legacy bulk grading should set results by pick_id."""
+        stamp = uuid4().hex[:8]
+        rows = [
+            (f"legacy-grade-{i}-{stamp}", "run-1", f"game-{i}", "BOS @ NYK", "NYK", "HOME",
+             60.0, "MEDIUM", None, None, None, None, None, None, None, "PENDING")
+            for i in range(2)
+        ]
+        upsert_picks_bulk(rows)
+        
+        assert grade_picks_bulk([(rows[0][0], "W"), (rows[1][0], "L")]) == 2
+        assert grade_picks_bulk([]) == 0
+    
+    def test_iter_ungraded_daily_picks(self):
+        """Streamed ungraded picks should match the list version and skip graded ones."""
+        slate_date = "2026-03-21"
+        stamp = uuid4().hex[:8]
+        game_ids = [f"ungraded-test-{i}-{stamp}" for i in range(2)]
+        for game_id in game_ids:
+            upsert_game(game_id=game_id, game_date=slate_date,
+                        away_team="PHX", home_team="DEN", status="scheduled")
+            upsert_daily_pick_if_unlocked(slate_date, game_id, {
+                'matchup': 'PHX @ DEN',
+                'pick_team': 'DEN',
+                'pick_side': 'HOME',
+                'conf_pct': 60.0,
+                'bucket': 'MEDIUM',
+            }, "2026-03-21T10:00:00")
+        grade_daily_pick(slate_date, game_ids[0], "L")
+        
+        streamed = list(iter_ungraded_daily_picks(slate_date))
+        pending_ids = {p['game_id'] for p in streamed}
+        
+        assert streamed == get_ungraded_daily_picks(slate_date)
+        assert game_ids[1] in pending_ids
+        assert game_ids[0] not in pending_ids
 
 
 class TestStatsComputation:
@@ -551,18 +955,102 @@ class TestStatsComputation:
         """WinrateStats should have all required fields."""
         stats = compute_stats()
         
-        # Check overall fields
-        assert hasattr(stats, 'total_picks')
-        assert hasattr(stats, 'total_graded')
-        assert hasattr(stats, 'wins')
-        assert hasattr(stats, 'losses')
-        assert hasattr(stats, 'win_pct')
-        assert hasattr(stats, 'pending')
+        required = {
+            # Overall fields
+            'total_picks', 'total_graded', 'wins', 'losses', 'win_pct', 'pending',
+            # Bucket fields
+            'high_total', 'med_total', 'low_total',
+        }
+        missing = required - {f.name for f in dataclasses.fields(stats)}
+        assert not missing, f"WinrateStats is missing {sorted(missing)}"
+    
+    def test_compute_stats_counts_new_picks(self):
+        """Grading picks should move counts between pending, wins and losses."""
+        slate_date = "2026-03-25"
+        before = compute_stats()
+        
+        with batch():
+            for i, (bucket, result) in enumerate([("HIGH", "W"), ("HIGH", "L"), ("LOW", None)]):
+                game_id = _unique_id(f"stats-test-{i}")
+                upsert_game(
+                    game_id=game_id,
+                    game_date=slate_date,
+                    away_team="BOS",
+                    home_team="NYK",
+                    status="scheduled"
+                )
+                pick_data = {
+                    'matchup': 'BOS @ NYK',
+                    'pick_team': 'NYK',
+                    'pick_side': 'HOME',
+                    'conf_pct': 60.0,
+                    'bucket': bucket,
+                }
+                upsert_daily_pick_if_unlocked(slate_date, game_id, pick_data, "2026-03-25T12:00:00")
+                if result:
+                    grade_daily_pick(slate_date, game_id, result)
+        
+        after = compute_stats()
+        assert after.total_picks - before.total_picks == 3
+        assert after.total_graded - before.total_graded == 2
+        assert after.wins - before.wins == 1
+        assert after.losses - before.losses == 1
+        assert after.pending - before.pending == 1
+        assert after.high_total - before.high_total == 2
+        assert after.high_wins - before.high_wins == 1
+        assert after.high_losses - before.high_losses == 1
+        assert after.low_pending - before.low_pending == 1
+        assert after.total_graded == after.wins + after.losses
+
+
+class TestExport:
+    """Tests for CSV export."""
+    
+    def test_export_to_csv(self, tmp_path):
+        """Export should write a header and the picks in the date range."""
+        game_id = _unique_id("export-test")
+        slate_date = "2026-04-01"
+        
+        upsert_game(
+            game_id=game_id,
+            game_date=slate_date,
+            away_team="BOS",
+            home_team="NYK",
+            status="scheduled"
+        )
+        pick_data = {
+            'matchup': 'BOS @ NYK',
+            'pick_team': 'NYK',
+            'pick_side': 'HOME',
+            'conf_pct': 63.0,
+            'bucket': 'MEDIUM',
+        }
+        upsert_daily_pick_if_unlocked(slate_date, game_id, pick_data, "2026-04-01T12:00:00")
+        
+        out = tmp_path / "export.csv"
+        export_to_csv(str(out), start_date=slate_date, end_date=slate_date)
+        
+        with open(out, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        
+        assert rows[0][0] == 'Date'
+        assert len(rows[0]) == 15
+        data = rows[1:]
+        assert data
+        assert all(row[0] == slate_date for row in data)
+        assert ['BOS', 'NYK', 'NYK', 'HOME'] in [row[1:5] for row in data]
+    
+    def test_export_to_csv_without_run_timestamp(self, tmp_path):
+        """Skipping the run timestamp should drop its column from every row."""
+        out = tmp_path / "export.csv"
+        export_to_csv(str(out), start_date="2026-04-01", end_date="2026-04-01",
+                      include_run_timestamp=False)
+        
+        with open(out, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
         
-        # Check bucket fields
-        assert hasattr(stats, 'high_total')
-        assert hasattr(stats, 'med_total')
-        assert hasattr(stats, 'low_total')
+        assert rows[0][-1] == 'Locked'
+        assert all(len(row) == 14 for row in rows)
 
 
 class TestTimeHelpers:
@@ -580,3 +1068,20 @@ class TestTimeHelpers:
         assert isinstance(today, str)
         assert len(today) == 10
         assert today.count('-') == 2
+    
+    def test_now_and_today_are_consistent(self):
+        """get_today_date_local should be the date part of get_now_local."""
+        assert get_today_date_local() == get_now_local()[:10]
+    
+    def test_utc_to_local_standard_time(self):
+        """UTC times in winter should convert to EST (UTC-5)."""
+        assert utc_to_local("2026-02-05T00:30:00Z") == "2026-02-04T19:30:00"
+    
+    def test_utc_to_local_daylight_time(self):
+        """UTC times in summer should convert to EDT (UTC-4)."""
+        assert utc_to_local("2026-04-10T23:00:00.000Z") == "2026-04-10T19:00:00"
+    
+    def test_utc_to_local_invalid(self):
+        """Unparseable or empty input should return None."""
+        assert utc_to_local("not a time") is None
+        assert utc_to_local("") is None